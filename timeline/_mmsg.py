@@ -0,0 +1,57 @@
+"""ctypes bindings for Linux sendmmsg()/recvmmsg(), shared by the player and recorder.
+
+Both calls move a whole burst of datagrams in one syscall. HAS_SENDMMSG and
+HAS_RECVMMSG are False on other platforms, where callers keep their per-packet
+socket loops.
+"""
+import ctypes
+import sys
+
+try:
+    libc = ctypes.CDLL("libc.so.6", use_errno=True) if sys.platform.startswith("linux") else None
+    HAS_SENDMMSG = libc is not None and hasattr(libc, "sendmmsg")
+    HAS_RECVMMSG = libc is not None and hasattr(libc, "recvmmsg")
+except Exception:
+    libc = None
+    HAS_SENDMMSG = False
+    HAS_RECVMMSG = False
+
+MSG_DONTWAIT = 0x40
+
+
+class SockaddrIn(ctypes.Structure):
+    _fields_ = [
+        ("sin_family", ctypes.c_ushort),
+        ("sin_port", ctypes.c_uint16),
+        ("sin_addr", ctypes.c_ubyte * 4),
+        ("sin_zero", ctypes.c_ubyte * 8),
+    ]
+
+
+class IOVec(ctypes.Structure):
+    _fields_ = [("iov_base", ctypes.c_void_p), ("iov_len", ctypes.c_size_t)]
+
+
+class MsgHdr(ctypes.Structure):
+    _fields_ = [
+        ("msg_name", ctypes.c_void_p),
+        ("msg_namelen", ctypes.c_uint32),
+        ("msg_iov", ctypes.POINTER(IOVec)),
+        ("msg_iovlen", ctypes.c_size_t),
+        ("msg_control", ctypes.c_void_p),
+        ("msg_controllen", ctypes.c_size_t),
+        ("msg_flags", ctypes.c_int),
+    ]
+
+
+class MMsgHdr(ctypes.Structure):
+    _fields_ = [("msg_hdr", MsgHdr), ("msg_len", ctypes.c_uint)]
+
+
+if HAS_SENDMMSG:
+    libc.sendmmsg.argtypes = [ctypes.c_int, ctypes.POINTER(MMsgHdr), ctypes.c_uint, ctypes.c_int]
+    libc.sendmmsg.restype = ctypes.c_int
+
+if HAS_RECVMMSG:
+    libc.recvmmsg.argtypes = [ctypes.c_int, ctypes.POINTER(MMsgHdr), ctypes.c_uint, ctypes.c_int, ctypes.c_void_p]
+    libc.recvmmsg.restype = ctypes.c_int
@@ -1,7 +1,8 @@
 """timeline.format
 
 Provide compact timeline serialization. Try to use msgpack when available,
-fall back to gzipped JSON when not.
+fall back to gzipped JSON when not. Raw ``bytes`` payloads are stored natively
+by msgpack and as base64 text in JSON.
 """
 import json
 import gzip
@@ -13,6 +14,19 @@ try:
 except Exception:
     msgpack = None
 
+# pybase64 wraps SIMD base64 kernels; same API as the stdlib encoder
+try:
+    from pybase64 import b64encode
+except Exception:
+    from base64 import b64encode
+
+
+def _json_default(obj):
+    """Encode raw payload bytes as base64 text for JSON output."""
+    if isinstance(obj, (bytes, bytearray, memoryview)):
+        return b64encode(bytes(obj)).decode('ascii')
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
 
 def save_timeline(obj: Any, path: str):
     """Save timeline object to `path`. If extension endswith .mpk use msgpack,
@@ -24,10 +38,10 @@ def save_timeline(obj: Any, path: str):
             f.write(packed)
     elif path.endswith('.gz'):
         with gzip.open(path, 'wt', encoding='utf-8') as f:
-            json.dump(obj, f)
+            json.dump(obj, f, default=_json_default)
     else:
         with open(path, 'w', encoding='utf-8') as f:
-            json.dump(obj, f, indent=2)
+            json.dump(obj, f, indent=2, default=_json_default)
 
 
 def load_timeline(path: str):
@@ -4,13 +4,13 @@ import threading
 import time
 import socket
 import base64
-from datetime import timedelta
 import wave
 import struct
 import os
 import sys
 import json
 import webbrowser
+from bisect import bisect_left, bisect_right
 
 # Initialize log file with clean ASCII header to avoid garbled remnants
 try:
@@ -80,11 +80,18 @@ def debug_log(msg: str):
     except Exception:
         pass
 
+# NumPy vectorises bulk time shifts; plain lists are used without it
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except Exception:
+    HAS_NUMPY = False
+
 try:
     import mutagen
     import soundfile as sf
-    import numpy as np
-    HAS_AUDIO = True
+    # Audio decoding and waveform analysis need NumPy as well
+    HAS_AUDIO = HAS_NUMPY
 except:
     HAS_AUDIO = False
 
@@ -108,6 +115,78 @@ except:
 
 HAS_MIDI = HAS_WINDOWS_MIDI or HAS_MIDI_MIDO
 
+# Pillow is used to pre-render the waveform into a single canvas image
+try:
+    from PIL import Image, ImageDraw, ImageTk
+    HAS_PIL = True
+except Exception:
+    HAS_PIL = False
+
+# Numba compiles the capture-side channel diff when installed
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except Exception:
+    HAS_NUMBA = False
+
+# Widest waveform image to render; wider timelines fall back to canvas lines
+_WAVEFORM_IMAGE_MAX_WIDTH = 32000
+# Number of zoom/height variants of the waveform image kept in memory
+_WAVEFORM_CACHE_SIZE = 8
+# Timelines with at least this many frames draw their blocks into one image
+_FRAME_IMAGE_MIN_FRAMES = 2000
+# Half-width (pixels) of the band recorded around a dragged marker, covering its block and label
+_DIRTY_BAND_PAD = 150
+# Cell size (pixels) of the spatial grid used to hit-test marker and frame boxes
+_HIT_CELL_W = 64
+_HIT_CELL_H = 32
+# Minimum interval (ms) between OSC tooltip hit tests while the mouse moves
+_TOOLTIP_THROTTLE_MS = 50
+# Block style (normal, selected) for OSC/MIDI/SMPTE markers, shared by drawing and selection recolouring
+_MARKER_SELECT_STYLES = {
+    "osc": ({"fill": "steelblue", "outline": "deepskyblue", "width": 1},
+            {"fill": "dodgerblue", "outline": "white", "width": 2}),
+    "midi": ({"fill": "mediumpurple", "outline": "purple", "width": 1},
+             {"fill": "magenta", "outline": "white", "width": 2}),
+    "smpte": ({"fill": "#2f4f4f", "outline": "#87cefa", "width": 1},
+              {"fill": "#4682b4", "outline": "white", "width": 2}),
+}
+# Loop region tint: green blended at ~25% onto the timeline's black background
+_LOOP_REGION_FILL = "#104010"
+# Art-Net port-address (SubUni + Net) at offset 14; the top bit is reserved
+_ARTNET_UNIVERSE = struct.Struct("<H")
+# DMX monitor value colour for each level 0..255
+_DMX_LEVEL_COLORS = ["gray50"] + ["orange"] * 84 + ["yellow"] * 85 + ["lime"] * 86
+
+
+def _diff_learned_kernel(frame, channels, baseline, out_ch, out_val):
+    """Write learned channels whose value differs from baseline to out_ch/out_val; return the count."""
+    n = 0
+    for k in range(channels.shape[0]):
+        ch = channels[k]
+        val = frame[ch]
+        if val != baseline[k]:
+            out_ch[n] = ch
+            out_val[n] = val
+            n += 1
+    return n
+
+
+if HAS_NUMBA:
+    _diff_learned_kernel = njit(cache=True)(_diff_learned_kernel)
+
+
+def _diff_learned_channels(frame, channels, baseline):
+    """Return {channel: value} for learned channels of a uint8 DMX frame that moved off baseline."""
+    if HAS_NUMBA:
+        out_ch = np.empty(channels.shape[0], dtype=np.int32)
+        out_val = np.empty(channels.shape[0], dtype=np.uint8)
+        n = _diff_learned_kernel(frame, channels, baseline, out_ch, out_val)
+        return dict(zip(out_ch[:n].tolist(), out_val[:n].tolist()))
+    values = frame[channels]
+    changed = values != baseline
+    return dict(zip(channels[changed].tolist(), values[changed].tolist()))
+
 
 class TimelineEditorGUI:
     def __init__(self, root):
@@ -130,10 +209,13 @@ class TimelineEditorGUI:
             pass
         
         self.timeline_data = None
+        # Latest event time in timeline_data, kept current on every mutation
+        self._timeline_max_t = 0.0
         self.is_playing = False
         self.playhead_pos = 0.0
         self.zoom_level = 100
         self.selected_universe = 0
+        # Latest DMX frame per universe: np.uint8[512] (bytearray(512) without NumPy)
         self.dmx_values = {}
         self.dmx_monitor_running = True
         self.recording = False
@@ -151,12 +233,48 @@ class TimelineEditorGUI:
         self.audio_duration = 0.0
         self.play_obj = None
         self.waveform_cached = False  # Cache flag to avoid redrawing waveform
+        # Marker/loop edits only need the overlay redrawn, not the waveform
+        self.markers_dirty = False
+        # Canvas x-bands touched by marker drags since the last redraw
+        self._dirty_regions = []
+        # Bumped on every edit; part of the layout key checked before a playhead-only redraw
+        self._edit_counter = 0
+        self._layout_cache_key = None
+        # Rendered waveform images keyed by (zoom bucket, canvas height)
+        self._waveform_cache = {}
+        # int16 NumPy copy of audio_data for vectorised waveform rendering
+        self._audio_arr = None
+        # Min/max peak pyramid over _audio_arr: level k holds (mins, maxs) per 2**k samples
+        self._waveform_pyramid = []
+        # Pooled grid items reused across redraws, and the canvas x-range drawn
+        self._grid_line_ids = []
+        self._grid_text_ids = []
+        self._drawn_x_range = None
+        # Pooled marker/session items reused across redraws: {pool tag: {item kind: [ids]}}
+        self._item_pools = {}
+        # Pool tag -> (first marker index, count) placed by the last draw
+        self._pool_spans = {}
+        # Lane -> (validity key, sorted times array, longest duration) used to cull markers
+        self._marker_time_cache = {}
+        self._playhead_id = None
+        # Coalesce bursts of redraw requests (e.g. drag motion) into one per idle turn
+        self._redraw_pending = False
         # Dirty state for save-on-exit prompt
         self.is_dirty = False
         
         # Art-Net frame selection
         self.selected_frame = None
         self.frame_boxes = {}  # Map frame index to canvas box coordinates
+        # Frame blocks rendered as one image for large timelines (kept alive for Tk)
+        self._frames_photo = None
+        # Marker box maps filled by each full redraw (index -> canvas box)
+        self.osc_marker_boxes = {}
+        self.midi_marker_boxes = {}
+        self.smpte_marker_boxes = {}
+        # Spatial index over marker boxes: {(cell_x, cell_y): [(idx, x1, y1, x2, y2, kind)]}
+        self._hit_grid = {}
+        # Same index for frame boxes, kept apart so overlay redraws can skip it
+        self._frame_hit_grid = {}
         
         # Drag-to-zoom
         self.drag_start = None
@@ -166,10 +284,31 @@ class TimelineEditorGUI:
         
         # Playhead dragging
         self.dragging_playhead = False
+        # Loop handle dragging
+        self._dragging_loop_in = False
+        self._dragging_loop_out = False
+        # Hover tooltip for OSC markers (created lazily)
+        self._osc_tooltip = None
+        self._osc_tooltip_label = None
+        self._tooltip_after = None
+        self._tooltip_event = None
+        # Large timecode label in the DMX monitor pane (created with the monitor layout)
+        self.monitor_timecode_label = None
         # Session dragging to shift all frames in a session
         self._dragging_session_id = None
         self._session_drag_start_x = None
         self._session_times_snapshot = None
+        self._session_drag_indices = None
+        # Column arrays of event times/sessions built at session-drag start (NumPy only)
+        self._t_arr = None
+        self._s_arr = None
+        self._session_mask = None
+        # Latest event time outside the dragged session, fixed for the whole drag
+        self._other_sessions_max_t = 0.0
+        # timeline_data list and its length when the session drag started; the column and
+        # indices above are only valid for that list (appends are fine, replacement is not)
+        self._session_drag_data = None
+        self._session_drag_len = 0
         # MIDI marker dragging
         self.drag_midi_index = None
         self._drag_midi_ref = None
@@ -181,8 +320,8 @@ class TimelineEditorGUI:
         # Capture indicator state
         self._set_record_indicator(False)
         
-        # DMX value cache for optimization
-        self._last_dmx_values = {}
+        # Last frame shown in the DMX monitor; None forces a full refresh
+        self._last_dmx_values = None
         
         # Undo/Redo stacks
         self.undo_stack = []
@@ -208,6 +347,11 @@ class TimelineEditorGUI:
         self._drag_osc_ref = None
         self._osc_drag_dt = 0.0
         self.selected_midi_marker = None
+        # Times of the dragged marker's sorted neighbours; re-sort only when crossed
+        self._drag_left_neighbor_t = float("-inf")
+        self._drag_right_neighbor_t = float("inf")
+        # Time of the dragged marker at press; release only redraws if it changed
+        self._drag_press_t = None
         
         # Loop region
         self.loop_enabled = False
@@ -253,6 +397,10 @@ class TimelineEditorGUI:
         self.ignored_on_capture_enabled = False
         self.ignored_on_capture = {}
         self.ignored_baseline = {}
+        # Per-universe (channels, baseline) arrays for the capture diff; rebuilt after learn/clear
+        self._learned_arrays = {}
+        # Last frame recorded per universe, so unchanged frames are not recorded again
+        self._last_captured_frame = {}
         # Session priority (advanced): enable flag and per-session priorities
         self.session_priority_enabled = False
         self.session_priorities = {}
@@ -653,6 +801,7 @@ class TimelineEditorGUI:
         """Create a new empty timeline and reset relevant state."""
         # Core timeline structures
         self.timeline_data = []
+        self._timeline_max_t = 0.0
         self.recorded_events = []
         self.session_bounds = {}
         self.selected_frame = None
@@ -666,6 +815,7 @@ class TimelineEditorGUI:
         self.audio_file = None
         self.audio_data = None
         self.audio_duration = 0.0
+        self._prepare_audio_arrays()
         try:
             if getattr(self, "audio_label", None):
                 self.audio_label.config(text="None", foreground="cyan")
@@ -728,12 +878,17 @@ class TimelineEditorGUI:
             self.undo_stack.pop(0)
         # Clear redo stack when new action is taken
         self.redo_stack = []
+        self._edit_counter += 1
         # Mark timeline as dirty on any change that records undo state
         try:
             self.is_dirty = True
         except Exception:
             pass
     
+    def _refresh_timeline_max_t(self):
+        """Recompute the cached latest event time after timeline_data changed."""
+        self._timeline_max_t = max((evt.get("t", 0) for evt in self.timeline_data), default=0) if self.timeline_data else 0
+
     def _undo(self):
         """Undo last action."""
         if not self.undo_stack:
@@ -752,9 +907,11 @@ class TimelineEditorGUI:
         # Restore previous state
         state = self.undo_stack.pop()
         self.timeline_data = state["timeline_data"]
+        self._refresh_timeline_max_t()
         self.session_names = state["session_names"]
         self.markers = state["markers"]
         self.osc_markers = state.get("osc_markers", getattr(self, "osc_markers", []))
+        self._edit_counter += 1
         self.waveform_cached = False
         self._update_canvas_view()
     
@@ -776,10 +933,12 @@ class TimelineEditorGUI:
         # Restore redo state
         state = self.redo_stack.pop()
         self.timeline_data = state["timeline_data"]
+        self._refresh_timeline_max_t()
         self.session_names = state["session_names"]
         self.markers = state["markers"]
         self.midi_markers = state.get("midi_markers", [])
         self.osc_markers = state.get("osc_markers", getattr(self, "osc_markers", []))
+        self._edit_counter += 1
         self.waveform_cached = False
         self._update_canvas_view()
 
@@ -805,7 +964,7 @@ class TimelineEditorGUI:
         try:
             if self.timeline_data:
                 # Use last event time if available
-                max_t = max(max_t, max((evt.get("t", 0.0) for evt in self.timeline_data), default=0.0))
+                max_t = max(max_t, self._timeline_max_t)
         except Exception:
             pass
         try:
@@ -890,7 +1049,7 @@ class TimelineEditorGUI:
                 self._save_undo_state()
                 self.markers.append({"t": self.playhead_pos, "label": label})
                 self.markers.sort(key=lambda m: m["t"])
-                self.waveform_cached = False
+                self.markers_dirty = True
                 self._update_canvas_view()
                 dialog.destroy()
         
@@ -917,7 +1076,7 @@ class TimelineEditorGUI:
         
         self._save_undo_state()
         self.markers.remove(closest_marker)
-        self.waveform_cached = False
+        self.markers_dirty = True
         self._update_canvas_view()
     
     def _set_loop_in(self):
@@ -926,7 +1085,7 @@ class TimelineEditorGUI:
         if self.loop_end <= self.loop_start:
             self.loop_end = self.loop_start + 5.0  # Default 5 second region
         self.loop_enabled = True
-        self.waveform_cached = False
+        self.markers_dirty = True
         self._update_canvas_view()
     
     def _set_loop_out(self):
@@ -935,13 +1094,13 @@ class TimelineEditorGUI:
         if self.loop_end <= self.loop_start:
             self.loop_start = max(0, self.loop_end - 5.0)  # Default 5 second region
         self.loop_enabled = True
-        self.waveform_cached = False
+        self.markers_dirty = True
         self._update_canvas_view()
     
     def _toggle_loop(self):
         """Toggle loop playback on/off."""
         self.loop_enabled = not self.loop_enabled
-        self.waveform_cached = False
+        self.markers_dirty = True
         self._update_canvas_view()
     
     def _clear_loop(self):
@@ -949,7 +1108,7 @@ class TimelineEditorGUI:
         self.loop_enabled = False
         self.loop_start = 0.0
         self.loop_end = 0.0
-        self.waveform_cached = False
+        self.markers_dirty = True
         self._update_canvas_view()
     
     def _add_midi_marker(self):
@@ -1209,7 +1368,7 @@ class TimelineEditorGUI:
                 }
                 self.midi_markers.append(midi_marker)
                 self.midi_markers.sort(key=lambda m: m["t"])
-                self.waveform_cached = False
+                self.markers_dirty = True
                 self._update_canvas_view()
                 dialog.destroy()
             except Exception as e:
@@ -1257,7 +1416,7 @@ class TimelineEditorGUI:
             self._save_undo_state()
             self.smpte_markers.append(m)
             self.smpte_markers.sort(key=lambda x: x.get("t", 0.0))
-            self.waveform_cached = False
+            self.markers_dirty = True
             self._update_canvas_view()
         except Exception as e:
             try:
@@ -1293,7 +1452,7 @@ class TimelineEditorGUI:
                 self._save_undo_state()
                 sm["name"] = name_var.get().strip() or "SMPTE"
                 sm["duration"] = float(dur_var.get())
-                self.waveform_cached = False
+                self.markers_dirty = True
                 self._update_canvas_view()
                 dialog.destroy()
             except Exception as e:
@@ -1307,7 +1466,7 @@ class TimelineEditorGUI:
                 self._save_undo_state()
                 self.smpte_markers.pop(idx)
                 self.selected_smpte_marker = None
-                self.waveform_cached = False
+                self.markers_dirty = True
                 self._update_canvas_view()
         except Exception:
             pass
@@ -1578,7 +1737,7 @@ class TimelineEditorGUI:
                     self.midi_presets[nm] = {"note": int(closest_marker["note"]), "velocity": int(closest_marker["velocity"]), "channel": int(closest_marker["channel"]), "duration": float(closest_marker["duration"]), "label": closest_marker["label"]}
                 except Exception:
                     pass
-                self.waveform_cached = False
+                self.markers_dirty = True
                 self._update_canvas_view()
                 dialog.destroy()
             except Exception as e:
@@ -1781,7 +1940,7 @@ class TimelineEditorGUI:
                 except Exception:
                     pass
                 self.osc_markers.sort(key=lambda m: m["t"])
-                self.waveform_cached = False
+                self.markers_dirty = True
                 self._update_canvas_view()
                 dialog.destroy()
             except Exception as e:
@@ -2000,7 +2159,7 @@ class TimelineEditorGUI:
                             self.recent_osc_ips = self.recent_osc_ips[-20:]
                 except Exception:
                     pass
-                self.waveform_cached = False
+                self.markers_dirty = True
                 self._update_canvas_view()
                 dialog.destroy()
             except Exception as e:
@@ -2059,7 +2218,7 @@ class TimelineEditorGUI:
         self._save_undo_state()
         self.midi_markers.remove(closest_marker)
         self.selected_midi_marker = None
-        self.waveform_cached = False
+        self.markers_dirty = True
         self._update_canvas_view()
     
     def _delete_all_midi_markers(self):
@@ -2074,7 +2233,7 @@ class TimelineEditorGUI:
             self._save_undo_state()
             self.midi_markers = []
             self.selected_midi_marker = None
-            self.waveform_cached = False
+            self.markers_dirty = True
             self._update_canvas_view()
     
     def _open_dmx_filter(self):
@@ -2298,8 +2457,8 @@ class TimelineEditorGUI:
                     return
                 learned_any = False
                 for u in universes:
-                    values = self.dmx_values.get(u, {})
-                    if not values:
+                    values = self.dmx_values.get(u)
+                    if values is None:
                         continue
                     # Initialize structures
                     if u not in self.ignored_on_capture:
@@ -2307,11 +2466,12 @@ class TimelineEditorGUI:
                     if u not in self.ignored_baseline:
                         self.ignored_baseline[u] = {}
                     # Learn channels currently with activity (>0)
-                    for ch, val in values.items():
+                    for ch, val in enumerate(values):
                         if val > 0:
                             self.ignored_on_capture[u].add(ch)
                             self.ignored_baseline[u][ch] = int(val)
                             learned_any = True
+                self._learned_arrays = {}
                 refresh_table()
                 if learned_any:
                     self._show_status("Learned active channels to ignore on capture")
@@ -2328,6 +2488,7 @@ class TimelineEditorGUI:
             try:
                 self.ignored_on_capture.clear()
                 self.ignored_baseline.clear()
+                self._learned_arrays = {}
                 refresh_table()
                 self._show_status("Cleared learned ignore list")
                 try:
@@ -2377,6 +2538,8 @@ class TimelineEditorGUI:
             if ch in self.dmx_labels:
                 self.dmx_labels[ch]["frame"].destroy()
         self.dmx_labels = {}
+        # New labels need every channel written on the next refresh
+        self._last_dmx_values = None
         
         # Reuse existing canvas if available, otherwise create it
         if not hasattr(self, "_monitor_canvas"):
@@ -2452,7 +2615,7 @@ class TimelineEditorGUI:
                 if not hasattr(self, "monitor_timecode_container"):
                     self.monitor_timecode_container = ttk.Frame(self.monitor_frame, padding=0, style="White.TFrame")
                     self.monitor_timecode_container.pack(fill="x", padx=8, pady=(0, 8))
-                if not hasattr(self, "monitor_timecode_label"):
+                if self.monitor_timecode_label is None:
                     self.monitor_timecode_label = tk.Label(self.monitor_timecode_container, text=self._format_time(self.playhead_pos),
                                                           bg="#ffffff", fg="#000000", font=("Segoe UI", 18, "bold"),
                                                           anchor="center", justify="center")
@@ -2593,8 +2756,16 @@ class TimelineEditorGUI:
             
             bar = tk.Canvas(frame, bg="gray30", width=bar_w, height=8, highlightthickness=0)
             bar.pack(pady=2)
+            # One persistent rectangle per channel; updates just move/recolour it
+            rid = bar.create_rectangle(0, 0, 0, 8, fill="gray20", outline="gray20")
             
-            self.dmx_labels[ch] = {"value": value_label, "bar": bar, "frame": frame}
+            entry = {"value": value_label, "bar": bar, "frame": frame, "bar_rect": rid, "bar_w": bar_w}
+            self.dmx_labels[ch] = entry
+            
+            # Cache the bar width instead of querying winfo_width() every tick
+            def _on_bar_configure(event, entry=entry):
+                entry["bar_w"] = max(40, int(event.width))
+            bar.bind("<Configure>", _on_bar_configure)
 
         # Enable mouse wheel scrolling on the monitor canvas
         def _on_mousewheel(event):
@@ -3725,6 +3896,9 @@ class TimelineEditorGUI:
         except Exception:
             pass
         self.canvas.bind("<Double-Button-1>", self._on_canvas_double_click)  # Double-click to edit
+        self.canvas.bind("<Motion>", self._schedule_osc_tooltip)  # Hover tooltip for OSC markers
+        # Grid is culled to the visible range, so redraw when the canvas is resized
+        self.canvas.bind("<Configure>", self._on_canvas_configure)
         self.root.bind("<Delete>", self._on_delete_key)  # Delete selected frame/session
         
         timeline_info_frame = ttk.Frame(self.timeline_frame)
@@ -4021,6 +4195,8 @@ class TimelineEditorGUI:
                 
                 self.audio_file = file_path
                 self.audio_label.config(text=fname, foreground="lime")
+                # New audio invalidates every rendered waveform image
+                self._prepare_audio_arrays()
                 
                 # Reset playhead to beginning
                 self.playhead_pos = 0.0
@@ -4075,8 +4251,12 @@ class TimelineEditorGUI:
                     except Exception:
                         session = 1
                     payload = evt.get("payload")
+                    # msgpack files may hold raw payload bytes; the editor works with base64 text
+                    if isinstance(payload, (bytes, bytearray)):
+                        payload = base64.b64encode(payload).decode("ascii")
                     normalized.append({"t": t, "universe": universe, "opcode": opcode, "session": session, "payload": payload})
                 self.timeline_data = normalized
+                self._refresh_timeline_max_t()
                 self.playhead_pos = 0.0
                 # Initialize capture session counter based on existing sessions in file
                 try:
@@ -4130,12 +4310,13 @@ class TimelineEditorGUI:
                                         pass
                                 
                                 self.audio_label.config(text=fname, foreground="lime")
+                                self._prepare_audio_arrays()
                             
                             # Load session names, markers, loop state, and network prefs
                             self.session_names = metadata.get("session_names", {})
                             # Convert string keys back to integers for session_names
                             self.session_names = {int(k): v for k, v in self.session_names.items()}
-                            self.markers = metadata.get("markers", [])
+                            self.markers = sorted(metadata.get("markers", []), key=lambda m: m.get("t", 0.0))
                             # Load MIDI markers and normalize types
                             raw_midi = metadata.get("midi_markers", [])
                             normalized_midi = []
@@ -4171,7 +4352,7 @@ class TimelineEditorGUI:
                                     "duration": duration,
                                     "label": label
                                 })
-                            self.midi_markers = normalized_midi
+                            self.midi_markers = sorted(normalized_midi, key=lambda m: m["t"])
                             # Load OSC markers and normalize types
                             raw_osc = metadata.get("osc_markers", [])
                             normalized_osc = []
@@ -4200,7 +4381,7 @@ class TimelineEditorGUI:
                                     "address": address,
                                     "args": args
                                 })
-                            self.osc_markers = normalized_osc
+                            self.osc_markers = sorted(normalized_osc, key=lambda m: m["t"])
                             # Load SMPTE markers
                             try:
                                 raw_smpte = metadata.get("smpte_markers", [])
@@ -4222,7 +4403,7 @@ class TimelineEditorGUI:
                                         "name": name,
                                         "duration": duration
                                     })
-                                self.smpte_markers = normalized_smpte
+                                self.smpte_markers = sorted(normalized_smpte, key=lambda m: m["t"])
                             except Exception:
                                 self.smpte_markers = []
                             # Load recent OSC IPs list
@@ -4272,6 +4453,8 @@ class TimelineEditorGUI:
                                         self.session_priority_var.set(self.session_priority_enabled)
                                 except Exception:
                                     pass
+                            except Exception:
+                                pass
                             # Load SMPTE settings
                             try:
                                 self.smpte_enabled = bool(metadata.get("smpte_enabled", self.settings.get("smpte_enabled", False)))
@@ -4402,6 +4585,7 @@ class TimelineEditorGUI:
             pass
         self.recording = True
         self.recorded_events = []
+        self._last_captured_frame = {}
         
         # Preserve current playhead position if already playing, otherwise start from beginning
         recording_start_offset = self.playhead_pos if self.is_playing else 0.0
@@ -4425,7 +4609,7 @@ class TimelineEditorGUI:
                 
                 # Update UI only every 100ms to prevent freezing
                 if self.playhead_pos - last_update >= 0.1:
-                    self.root.after(0, self._update_canvas_view)
+                    self._request_redraw(33)
                     last_update = self.playhead_pos
                 
                 time.sleep(0.05)
@@ -4448,6 +4632,7 @@ class TimelineEditorGUI:
                                 self.timeline_data = []
                             if getattr(self, 'recorded_events', None):
                                 self.timeline_data.extend(self.recorded_events)
+                            self._refresh_timeline_max_t()
                             # Refresh view
                             self._update_canvas_view()
                         except Exception:
@@ -4477,6 +4662,7 @@ class TimelineEditorGUI:
         if not self.timeline_data:
             self.timeline_data = []
         self.timeline_data.extend(self.recorded_events)
+        self._refresh_timeline_max_t()
         self._update_canvas_view()
         
         # Update capture indicator
@@ -4535,7 +4721,7 @@ class TimelineEditorGUI:
                 if self.audio_file:
                     max_duration = self.audio_duration
                 elif self.timeline_data:
-                    max_duration = max([e.get('t', 0) for e in self.timeline_data], default=0)
+                    max_duration = self._timeline_max_t
                 elif self.midi_markers:
                     max_duration = max([m['t'] + m.get('duration', 0.1) for m in self.midi_markers], default=10.0)
                 else:
@@ -4623,7 +4809,7 @@ class TimelineEditorGUI:
                                     pass
                     
                     # Update canvas
-                    self.root.after(0, self._update_canvas_view)
+                    self._request_redraw(33)
                     
                     # Stop when audio ends (unless looping)
                     if not self.loop_enabled and self.playhead_pos >= max_duration:
@@ -5043,7 +5229,7 @@ class TimelineEditorGUI:
             smpte_max = 0.0
         max_time = max(
             self.audio_duration if self.audio_data else 0,
-            max((evt.get("t", 0) for evt in self.timeline_data), default=0) if self.timeline_data else 0,
+            self._timeline_max_t,
             smpte_max
         )
         total_width = int(max_time * self.zoom_level) + 100 if max_time > 0 else canvas_width
@@ -5052,7 +5238,7 @@ class TimelineEditorGUI:
             # Center view on playhead
             target_x = playhead_x_after - canvas_width / 2
             target_scroll = max(0, min(1.0, target_x / (total_width - canvas_width)))
-            self.canvas.xview_moveto(target_scroll)
+            self._scroll_to(target_scroll)
 
     def _show_keyboard_shortcuts(self):
         """Show a popup window listing all keyboard shortcuts."""
@@ -5184,7 +5370,7 @@ class TimelineEditorGUI:
             return
         max_time = max(
             self.audio_duration if self.audio_data else 0,
-            max((evt.get("t", 0) for evt in self.timeline_data), default=0) if self.timeline_data else 0
+            self._timeline_max_t
         )
         if max_time <= 0:
             self.zoom_level = 100
@@ -5213,7 +5399,7 @@ class TimelineEditorGUI:
         except Exception:
             self._monitor_debounce_until = None
         # Clear last values so next loop refreshes labels without layout rebuild
-        self._last_dmx_values = {}
+        self._last_dmx_values = None
     
     def _on_canvas_click(self, event):
         """Handle canvas click to select frame or seek playhead."""
@@ -5263,84 +5449,101 @@ class TimelineEditorGUI:
                         self.selected_marker_time = marker["t"]
                     except Exception:
                         pass
-                    self.waveform_cached = False
+                    self.markers_dirty = True
                     self._update_canvas_view()
                     return
         
         # Check if clicking on a MIDI marker
-        if hasattr(self, 'midi_marker_boxes') and self.midi_marker_boxes:
-            for idx, (x1, y1, x2, y2) in self.midi_marker_boxes.items():
-                if x1 <= canvas_x <= x2 and y1 <= canvas_y <= y2:
-                    # MIDI marker clicked - select it (do not move playhead)
-                    self.selected_midi_marker = idx
-                    self.selected_frame = None
-                    self.selected_session = None
-                    # Prepare for dragging horizontally: keep initial offset
-                    try:
-                        marker_t = float(self.midi_markers[idx]["t"]) if self.midi_markers[idx] else 0.0
-                    except Exception:
-                        marker_t = 0.0
-                    self._midi_drag_dt = (canvas_x / self.zoom_level) - marker_t
-                    self.drag_midi_index = idx
-                    self._drag_midi_ref = self.midi_markers[idx]
-                    try:
-                        self.canvas.config(cursor="fleur")
-                    except Exception:
-                        pass
-                    self.waveform_cached = False
-                    self._update_canvas_view()
-                    return
+        idx = self._hit_test(canvas_x, canvas_y, "midi") if self.midi_marker_boxes else None
+        if idx is not None:
+            # MIDI marker clicked - select it (do not move playhead)
+            # Recolour in place when only the marker selection changes
+            in_place = self._layout_is_current() and self.selected_frame is None and self.selected_session is None
+            prev_selected = self.selected_midi_marker
+            self.selected_midi_marker = idx
+            self.selected_frame = None
+            self.selected_session = None
+            # Prepare for dragging horizontally: keep initial offset
+            try:
+                marker_t = float(self.midi_markers[idx]["t"]) if self.midi_markers[idx] else 0.0
+            except Exception:
+                marker_t = 0.0
+            self._midi_drag_dt = (canvas_x / self.zoom_level) - marker_t
+            self.drag_midi_index = idx
+            self._drag_midi_ref = self.midi_markers[idx]
+            self._drag_press_t = marker_t
+            self._drag_left_neighbor_t, self._drag_right_neighbor_t = self._marker_neighbor_times(self.midi_markers, idx)
+            try:
+                self.canvas.config(cursor="fleur")
+            except Exception:
+                pass
+            if in_place:
+                self._restyle_marker_selection("midi", prev_selected, idx)
+                return
+            self.markers_dirty = True
+            self._update_canvas_view()
+            return
 
         # Check if clicking on an OSC marker
-        if hasattr(self, 'osc_marker_boxes') and self.osc_marker_boxes:
-            for idx, (x1, y1, x2, y2) in self.osc_marker_boxes.items():
-                if x1 <= canvas_x <= x2 and y1 <= canvas_y <= y2:
-                    # OSC marker clicked - select it (do not move playhead)
-                    self.selected_osc_marker = idx
-                    try:
-                        marker_t = float(self.osc_markers[idx].get("t", 0.0)) if self.osc_markers[idx] else 0.0
-                    except Exception:
-                        marker_t = 0.0
-                    # Prepare for dragging horizontally
-                    self._osc_drag_dt = (canvas_x / self.zoom_level) - marker_t
-                    self.drag_osc_index = idx
-                    self._drag_osc_ref = self.osc_markers[idx]
-                    try:
-                        self.canvas.config(cursor="fleur")
-                    except Exception:
-                        pass
-                    self.selected_frame = None
-                    self.selected_session = None
-                    self.waveform_cached = False
-                    self._update_canvas_view()
-                    return
+        idx = self._hit_test(canvas_x, canvas_y, "osc") if self.osc_marker_boxes else None
+        if idx is not None:
+            # OSC marker clicked - select it (do not move playhead)
+            in_place = self._layout_is_current() and self.selected_frame is None and self.selected_session is None
+            prev_selected = self.selected_osc_marker
+            self.selected_osc_marker = idx
+            try:
+                marker_t = float(self.osc_markers[idx].get("t", 0.0)) if self.osc_markers[idx] else 0.0
+            except Exception:
+                marker_t = 0.0
+            # Prepare for dragging horizontally
+            self._osc_drag_dt = (canvas_x / self.zoom_level) - marker_t
+            self.drag_osc_index = idx
+            self._drag_osc_ref = self.osc_markers[idx]
+            self._drag_press_t = marker_t
+            self._drag_left_neighbor_t, self._drag_right_neighbor_t = self._marker_neighbor_times(self.osc_markers, idx)
+            try:
+                self.canvas.config(cursor="fleur")
+            except Exception:
+                pass
+            self.selected_frame = None
+            self.selected_session = None
+            if in_place:
+                self._restyle_marker_selection("osc", prev_selected, idx)
+                return
+            self.markers_dirty = True
+            self._update_canvas_view()
+            return
 
         # Check if clicking on a SMPTE marker
-        if hasattr(self, 'smpte_marker_boxes') and self.smpte_marker_boxes:
-            for idx, (x1, y1, x2, y2) in self.smpte_marker_boxes.items():
-                if x1 <= canvas_x <= x2 and y1 <= canvas_y <= y2:
-                    # SMPTE marker clicked - select it (do not move playhead)
-                    self.selected_smpte_marker = idx
-                    try:
-                        marker_t = float(self.smpte_markers[idx].get("t", 0.0)) if self.smpte_markers[idx] else 0.0
-                    except Exception:
-                        marker_t = 0.0
-                    # Prepare for dragging horizontally
-                    self._smpte_drag_dt = (canvas_x / self.zoom_level) - marker_t
-                    self.drag_smpte_index = idx
-                    self._drag_smpte_ref = self.smpte_markers[idx]
-                    try:
-                        self.canvas.config(cursor="fleur")
-                    except Exception:
-                        pass
-                    self.selected_frame = None
-                    self.selected_session = None
-                    self.waveform_cached = False
-                    self._update_canvas_view()
-                    return
+        idx = self._hit_test(canvas_x, canvas_y, "smpte") if self.smpte_marker_boxes else None
+        if idx is not None:
+            # SMPTE marker clicked - select it (do not move playhead)
+            in_place = self._layout_is_current() and self.selected_frame is None and self.selected_session is None
+            prev_selected = self.selected_smpte_marker
+            self.selected_smpte_marker = idx
+            try:
+                marker_t = float(self.smpte_markers[idx].get("t", 0.0)) if self.smpte_markers[idx] else 0.0
+            except Exception:
+                marker_t = 0.0
+            # Prepare for dragging horizontally
+            self._smpte_drag_dt = (canvas_x / self.zoom_level) - marker_t
+            self.drag_smpte_index = idx
+            self._drag_smpte_ref = self.smpte_markers[idx]
+            try:
+                self.canvas.config(cursor="fleur")
+            except Exception:
+                pass
+            self.selected_frame = None
+            self.selected_session = None
+            if in_place:
+                self._restyle_marker_selection("smpte", prev_selected, idx)
+                return
+            self.markers_dirty = True
+            self._update_canvas_view()
+            return
         
         # Check if clicking on a session box
-        if self.timeline_data and getattr(self, "session_bounds", {}):
+        if self.timeline_data and self.session_bounds:
             for s_id, (x1, x2, y1, y2) in self.session_bounds.items():
                 if x1 <= canvas_x <= x2 and y1 <= canvas_y <= y2:
                     # Start session drag to shift all frames (horizontal only)
@@ -5348,11 +5551,27 @@ class TimelineEditorGUI:
                     self.selected_frame = None
                     self._dragging_session_id = s_id
                     self._session_drag_start_x = canvas_x
+                    self._session_drag_data = self.timeline_data
+                    self._session_drag_len = len(self.timeline_data)
                     # Snapshot original times for this session for incremental dragging
                     try:
-                        self._session_times_snapshot = [e.get('t', 0.0) for e in self.timeline_data if e.get('session', 1) == s_id]
+                        if HAS_NUMPY:
+                            n = len(self.timeline_data)
+                            self._t_arr = np.fromiter((e.get('t', 0.0) for e in self.timeline_data), dtype=np.float64, count=n)
+                            self._s_arr = np.fromiter((e.get('session', 1) for e in self.timeline_data), dtype=np.int64, count=n)
+                            self._session_mask = self._s_arr == s_id
+                            self._session_times_snapshot = self._t_arr[self._session_mask].copy()
+                            others = self._t_arr[~self._session_mask]
+                            self._other_sessions_max_t = float(others.max()) if len(others) else 0.0
+                            self._session_drag_indices = np.flatnonzero(self._session_mask)
+                        else:
+                            indices = [i for i, e in enumerate(self.timeline_data) if e.get('session', 1) == s_id]
+                            self._session_times_snapshot = [float(self.timeline_data[i].get('t', 0.0)) for i in indices]
+                            self._session_drag_indices = indices
                     except Exception:
                         self._session_times_snapshot = None
+                        self._session_drag_indices = None
+                        self._t_arr = self._s_arr = self._session_mask = None
                     try:
                         self.canvas.config(cursor="sb_h_double_arrow")
                     except Exception:
@@ -5365,13 +5584,13 @@ class TimelineEditorGUI:
 
         # Check if clicking on a frame
         if self.timeline_data and self.frame_boxes:
-            for frame_idx, (x1, y1, x2, y2) in self.frame_boxes.items():
-                if x1 <= canvas_x <= x2 and y1 <= canvas_y <= y2:
-                    # Frame clicked - select it
-                    self.selected_frame = frame_idx
-                    self.selected_session = None
-                    self._update_canvas_view()
-                    return
+            frame_idx = self._hit_test(canvas_x, canvas_y, "frame")
+            if frame_idx is not None:
+                # Frame clicked - select it
+                self.selected_frame = frame_idx
+                self.selected_session = None
+                self._update_canvas_view()
+                return
         
         # Not clicking on frame/marker - seek playhead
         self.playhead_pos = canvas_x / self.zoom_level
@@ -5386,30 +5605,27 @@ class TimelineEditorGUI:
         canvas_y = self.canvas.canvasy(event.y)
         
         # Check if double-clicking on a MIDI marker - open editor
-        if hasattr(self, 'midi_marker_boxes') and self.midi_marker_boxes:
-            for idx, (x1, y1, x2, y2) in self.midi_marker_boxes.items():
-                if x1 <= canvas_x <= x2 and y1 <= canvas_y <= y2:
-                    # Open editor without moving playhead
-                    self._edit_midi_marker()
-                    return
+        idx = self._hit_test(canvas_x, canvas_y, "midi") if self.midi_marker_boxes else None
+        if idx is not None:
+            # Open editor without moving playhead
+            self._edit_midi_marker()
+            return
 
         # Check if double-clicking on an OSC marker - open editor
-        if hasattr(self, 'osc_marker_boxes') and self.osc_marker_boxes:
-            for idx, (x1, y1, x2, y2) in self.osc_marker_boxes.items():
-                if x1 <= canvas_x <= x2 and y1 <= canvas_y <= y2:
-                    # Open editor without moving playhead
-                    self._edit_osc_marker(idx)
-                    return
+        idx = self._hit_test(canvas_x, canvas_y, "osc") if self.osc_marker_boxes else None
+        if idx is not None:
+            # Open editor without moving playhead
+            self._edit_osc_marker(idx)
+            return
 
         # Check if double-clicking on a SMPTE marker - open editor
-        if hasattr(self, 'smpte_marker_boxes') and self.smpte_marker_boxes:
-            for idx, (x1, y1, x2, y2) in self.smpte_marker_boxes.items():
-                if x1 <= canvas_x <= x2 and y1 <= canvas_y <= y2:
-                    self._edit_smpte_marker(idx)
-                    return
+        idx = self._hit_test(canvas_x, canvas_y, "smpte") if self.smpte_marker_boxes else None
+        if idx is not None:
+            self._edit_smpte_marker(idx)
+            return
         
         # Check if double-clicking on a session box (Art-Net session)
-        if self.timeline_data and getattr(self, "session_bounds", {}):
+        if self.timeline_data and self.session_bounds:
             for s_id, (x1, x2, y1, y2) in self.session_bounds.items():
                 if x1 <= canvas_x <= x2 and y1 <= canvas_y <= y2:
                     # Select entire session
@@ -5425,11 +5641,11 @@ class TimelineEditorGUI:
         
         # Check if double-clicking on a frame
         if self.timeline_data and self.frame_boxes:
-            for frame_idx, (x1, y1, x2, y2) in self.frame_boxes.items():
-                if x1 <= canvas_x <= x2 and y1 <= canvas_y <= y2:
-                    # Open frame editor dialog
-                    self._open_frame_editor(frame_idx)
-                    return
+            frame_idx = self._hit_test(canvas_x, canvas_y, "frame")
+            if frame_idx is not None:
+                # Open frame editor dialog
+                self._open_frame_editor(frame_idx)
+                return
     
     def _open_frame_editor(self, frame_idx):
         """Open a popup window to view and edit frame data."""
@@ -5498,6 +5714,7 @@ class TimelineEditorGUI:
         def save_changes():
             try:
                 frame['t'] = time_var.get()
+                self._refresh_timeline_max_t()
                 frame['universe'] = universe_var.get()
                 frame['opcode'] = opcode_var.get()
                 self.waveform_cached = False
@@ -5519,64 +5736,63 @@ class TimelineEditorGUI:
         # Context menu for markers (OSC/MIDI/SMPTE)
         try:
             # Check OSC marker hit first
-            if hasattr(self, 'osc_marker_boxes') and self.osc_marker_boxes:
-                for idx, (x1, y1, x2, y2) in self.osc_marker_boxes.items():
-                    if x1 <= canvas_x <= x2 and y1 <= canvas_y <= y2:
-                        self.selected_osc_marker = idx
-                        menu = tk.Menu(self.root, tearoff=0)
-                        menu.add_command(label="Edit OSC Marker", command=lambda i=idx: self._edit_osc_marker(i))
-                        menu.add_command(label="Delete OSC Marker", command=lambda i=idx: self._delete_osc_marker(i))
-                        try:
-                            menu.tk_popup(self.root.winfo_pointerx(), self.root.winfo_pointery())
-                        finally:
-                            menu.grab_release()
-                        return
+            if self.osc_marker_boxes:
+                idx = self._hit_test(canvas_x, canvas_y, "osc")
+                if idx is not None:
+                    self.selected_osc_marker = idx
+                    menu = tk.Menu(self.root, tearoff=0)
+                    menu.add_command(label="Edit OSC Marker", command=lambda i=idx: self._edit_osc_marker(i))
+                    menu.add_command(label="Delete OSC Marker", command=lambda i=idx: self._delete_osc_marker(i))
+                    try:
+                        menu.tk_popup(self.root.winfo_pointerx(), self.root.winfo_pointery())
+                    finally:
+                        menu.grab_release()
+                    return
             # Check MIDI marker hit
-            if hasattr(self, 'midi_marker_boxes') and self.midi_marker_boxes:
-                for idx, (x1, y1, x2, y2) in self.midi_marker_boxes.items():
-                    if x1 <= canvas_x <= x2 and y1 <= canvas_y <= y2:
-                        self.selected_midi_marker = idx
-                        menu = tk.Menu(self.root, tearoff=0)
-                        menu.add_command(label="Edit MIDI Marker", command=self._edit_midi_marker)
-                        menu.add_command(label="Delete MIDI Marker", command=lambda: self._delete_selected_midi_marker())
-                        try:
-                            menu.tk_popup(self.root.winfo_pointerx(), self.root.winfo_pointery())
-                        finally:
-                            menu.grab_release()
-                        return
+            if self.midi_marker_boxes:
+                idx = self._hit_test(canvas_x, canvas_y, "midi")
+                if idx is not None:
+                    self.selected_midi_marker = idx
+                    menu = tk.Menu(self.root, tearoff=0)
+                    menu.add_command(label="Edit MIDI Marker", command=self._edit_midi_marker)
+                    menu.add_command(label="Delete MIDI Marker", command=lambda: self._delete_selected_midi_marker())
+                    try:
+                        menu.tk_popup(self.root.winfo_pointerx(), self.root.winfo_pointery())
+                    finally:
+                        menu.grab_release()
+                    return
             # Check SMPTE marker hit
-            if hasattr(self, 'smpte_marker_boxes') and self.smpte_marker_boxes:
-                for idx, (x1, y1, x2, y2) in self.smpte_marker_boxes.items():
-                    if x1 <= canvas_x <= x2 and y1 <= canvas_y <= y2:
-                        self.selected_smpte_marker = idx
-                        menu = tk.Menu(self.root, tearoff=0)
-                        menu.add_command(label="Edit SMPTE Marker", command=lambda i=idx: self._edit_smpte_marker(i))
-                        menu.add_command(label="Delete SMPTE Marker", command=lambda i=idx: self._delete_smpte_marker(i))
-                        try:
-                            menu.tk_popup(self.root.winfo_pointerx(), self.root.winfo_pointery())
-                        finally:
-                            menu.grab_release()
-                        return
+            if self.smpte_marker_boxes:
+                idx = self._hit_test(canvas_x, canvas_y, "smpte")
+                if idx is not None:
+                    self.selected_smpte_marker = idx
+                    menu = tk.Menu(self.root, tearoff=0)
+                    menu.add_command(label="Edit SMPTE Marker", command=lambda i=idx: self._edit_smpte_marker(i))
+                    menu.add_command(label="Delete SMPTE Marker", command=lambda i=idx: self._delete_smpte_marker(i))
+                    try:
+                        menu.tk_popup(self.root.winfo_pointerx(), self.root.winfo_pointery())
+                    finally:
+                        menu.grab_release()
+                    return
         except Exception:
             pass
 
         # If right-clicking on an OSC marker, delete it
-        if hasattr(self, 'osc_marker_boxes') and self.osc_marker_boxes:
-            for idx, (x1, y1, x2, y2) in self.osc_marker_boxes.items():
-                if x1 <= canvas_x <= x2 and y1 <= canvas_y <= y2:
-                    if 0 <= idx < len(self.osc_markers):
-                        try:
-                            self._save_undo_state()
-                        except Exception:
-                            pass
-                        self.osc_markers.pop(idx)
-                        self.selected_osc_marker = None
-                        self.waveform_cached = False
-                        self._update_canvas_view()
-                        return
+        if self.osc_marker_boxes:
+            idx = self._hit_test(canvas_x, canvas_y, "osc")
+            if idx is not None and 0 <= idx < len(self.osc_markers):
+                try:
+                    self._save_undo_state()
+                except Exception:
+                    pass
+                self.osc_markers.pop(idx)
+                self.selected_osc_marker = None
+                self.markers_dirty = True
+                self._update_canvas_view()
+                return
 
         # Session context menu: edit name or delete session
-        if self.timeline_data and getattr(self, "session_bounds", {}):
+        if self.timeline_data and self.session_bounds:
             for s_id, (x1, x2, y1, y2) in self.session_bounds.items():
                 if x1 <= canvas_x <= x2 and y1 <= canvas_y <= y2:
                     self.selected_session = s_id
@@ -5588,6 +5804,7 @@ class TimelineEditorGUI:
                         except Exception:
                             pass
                         self.timeline_data = [e for e in self.timeline_data if e.get("session", 1) != s_id]
+                        self._refresh_timeline_max_t()
                         try:
                             if s_id in self.session_names:
                                 del self.session_names[s_id]
@@ -5614,7 +5831,7 @@ class TimelineEditorGUI:
                 pass
             self.osc_markers.pop(self.selected_osc_marker)
             self.selected_osc_marker = None
-            self.waveform_cached = False
+            self.markers_dirty = True
             self._update_canvas_view()
             return
         # Check if MIDI marker is selected
@@ -5622,7 +5839,7 @@ class TimelineEditorGUI:
             self._save_undo_state()
             self.midi_markers.pop(self.selected_midi_marker)
             self.selected_midi_marker = None
-            self.waveform_cached = False
+            self.markers_dirty = True
             self._update_canvas_view()
             return
         
@@ -5632,6 +5849,7 @@ class TimelineEditorGUI:
                 self._save_undo_state()
                 s_id = self.selected_session
                 self.timeline_data = [e for e in self.timeline_data if e.get("session", 1) != s_id]
+                self._refresh_timeline_max_t()
                 self.selected_session = None
                 self.selected_frame = None
                 self.waveform_cached = False
@@ -5641,6 +5859,7 @@ class TimelineEditorGUI:
                 # Save undo state before deletion
                 self._save_undo_state()
                 self.timeline_data.pop(self.selected_frame)
+                self._refresh_timeline_max_t()
                 self.selected_frame = None
                 self.waveform_cached = False
                 self._update_canvas_view()
@@ -5654,7 +5873,7 @@ class TimelineEditorGUI:
                 self.osc_markers.pop(idx)
                 if self.selected_osc_marker == idx:
                     self.selected_osc_marker = None
-                self.waveform_cached = False
+                self.markers_dirty = True
                 self._update_canvas_view()
         except Exception:
             pass
@@ -5665,14 +5884,84 @@ class TimelineEditorGUI:
                 self._save_undo_state()
                 self.midi_markers.pop(self.selected_midi_marker)
                 self.selected_midi_marker = None
-                self.waveform_cached = False
+                self.markers_dirty = True
                 self._update_canvas_view()
         except Exception:
             pass
 
+    @staticmethod
+    def _marker_neighbor_times(markers, idx):
+        """Return the times of the markers on either side of markers[idx] in a sorted list."""
+        left = markers[idx - 1].get("t", 0.0) if idx > 0 else float("-inf")
+        right = markers[idx + 1].get("t", 0.0) if idx + 1 < len(markers) else float("inf")
+        return left, right
+
+    def _session_drag_list_intact(self):
+        """True while timeline_data is the list the session drag started on and has not shrunk."""
+        data = self.timeline_data
+        return data is not None and data is self._session_drag_data and len(data) >= self._session_drag_len
+
+    def _build_hit_grid(self, frames=True):
+        """Index marker (and, with `frames`, frame) boxes into grid cells for constant-time hit tests."""
+        self._hit_grid = self._index_boxes((
+            ("osc", self.osc_marker_boxes),
+            ("midi", self.midi_marker_boxes),
+            ("smpte", self.smpte_marker_boxes),
+        ))
+        if frames:
+            self._frame_hit_grid = self._index_boxes((("frame", self.frame_boxes),))
+
+    @staticmethod
+    def _index_boxes(sources):
+        """Return {(cell_x, cell_y): [(idx, x1, y1, x2, y2, kind)]} for (kind, boxes) sources."""
+        grid = {}
+        for kind, boxes in sources:
+            for idx, (x1, y1, x2, y2) in boxes.items():
+                entry = (idx, x1, y1, x2, y2, kind)
+                for cx in range(int(x1) // _HIT_CELL_W, int(x2) // _HIT_CELL_W + 1):
+                    for cy in range(int(y1) // _HIT_CELL_H, int(y2) // _HIT_CELL_H + 1):
+                        grid.setdefault((cx, cy), []).append(entry)
+        return grid
+
+    def _hit_test(self, canvas_x, canvas_y, kind):
+        """Return the index of the first `kind` box containing the point, or None."""
+        cell = (int(canvas_x) // _HIT_CELL_W, int(canvas_y) // _HIT_CELL_H)
+        grid = self._frame_hit_grid if kind == "frame" else self._hit_grid
+        for idx, x1, y1, x2, y2, k in grid.get(cell, ()):
+            if k == kind and x1 <= canvas_x <= x2 and y1 <= canvas_y <= y2:
+                return idx
+        return None
+
+    def _schedule_osc_tooltip(self, event):
+        """Throttle <Motion>: hit-test at most once per _TOOLTIP_THROTTLE_MS using the latest event."""
+        self._tooltip_event = event
+        if self._tooltip_after is None:
+            self._tooltip_after = self.root.after(_TOOLTIP_THROTTLE_MS, self._run_osc_tooltip)
+
+    def _run_osc_tooltip(self):
+        self._tooltip_after = None
+        if self._tooltip_event is not None:
+            self._maybe_show_osc_tooltip(self._tooltip_event)
+
+    def _maybe_show_osc_tooltip(self, event):
+        """Show the OSC tooltip when hovering a marker, using the hit grid for lookup."""
+        try:
+            cx = self.canvas.canvasx(event.x)
+            cy = self.canvas.canvasy(event.y)
+            idx = self._hit_test(cx, cy, "osc") if self.osc_marker_boxes else None
+            if idx is not None and 0 <= idx < len(self.osc_markers):
+                m = self.osc_markers[idx]
+                txt = f"{m.get('name','OSC')}\n{m.get('ip','')}:{m.get('port',0)}\n{m.get('address','/')} {m.get('args', [])}"
+                # Use absolute screen coords for tooltip placement
+                self._show_osc_tooltip(self.root.winfo_pointerx(), self.root.winfo_pointery(), txt)
+                return
+            self._hide_osc_tooltip()
+        except Exception:
+            pass
+
     def _ensure_osc_tooltip(self):
         try:
-            if getattr(self, '_osc_tooltip', None) is None:
+            if self._osc_tooltip is None:
                 tip = tk.Toplevel(self.root)
                 tip.overrideredirect(True)
                 tip.withdraw()
@@ -5686,7 +5975,7 @@ class TimelineEditorGUI:
 
     def _hide_osc_tooltip(self):
         try:
-            if getattr(self, '_osc_tooltip', None):
+            if self._osc_tooltip:
                 self._osc_tooltip.withdraw()
         except Exception:
             pass
@@ -5694,9 +5983,9 @@ class TimelineEditorGUI:
     def _show_osc_tooltip(self, x: int, y: int, text: str):
         try:
             self._ensure_osc_tooltip()
-            if getattr(self, '_osc_tooltip_label', None):
+            if self._osc_tooltip_label:
                 self._osc_tooltip_label.config(text=text)
-            if getattr(self, '_osc_tooltip', None):
+            if self._osc_tooltip:
                 # Position near cursor
                 self._osc_tooltip.geometry(f"+{x+12}+{y+12}")
                 self._osc_tooltip.deiconify()
@@ -5705,142 +5994,129 @@ class TimelineEditorGUI:
     
     def _on_canvas_drag(self, event):
         """Handle canvas drag to create zoom selection box or drag playhead."""
-        # Hide tooltip while dragging
-        self._hide_osc_tooltip()
-        # Handle playhead dragging
-        if self.dragging_playhead:
-            canvas_x = self.canvas.canvasx(event.x)
-            self.playhead_pos = max(0, canvas_x / self.zoom_level)
-            # Delete old playhead and redraw at new position without full canvas redraw
-            self.canvas.delete("playhead")
-            canvas_height = self.canvas.winfo_height()
-            playhead_x = self.playhead_pos * self.zoom_level
-            self.canvas.create_line(playhead_x, 0, playhead_x, canvas_height, fill="red", width=2, tags="playhead")
-            self.playhead_label.config(text=self._format_time(self.playhead_pos))
-            try:
-                if hasattr(self, "monitor_timecode_label") and self.monitor_timecode_label:
+        # Single guard for the Tk callback; the branches below validate inputs explicitly
+        try:
+            # Hide tooltip while dragging
+            self._hide_osc_tooltip()
+            zoom = self.zoom_level if self.zoom_level else 1.0
+            # Handle playhead dragging
+            if self.dragging_playhead:
+                canvas_x = self.canvas.canvasx(event.x)
+                self.playhead_pos = max(0, canvas_x / zoom)
+                # Move the playhead without a full canvas redraw
+                self._place_playhead(self.canvas.winfo_height())
+                self.playhead_label.config(text=self._format_time(self.playhead_pos))
+                if self.monitor_timecode_label:
                     self.monitor_timecode_label.config(text=self._format_time(self.playhead_pos))
-            except Exception:
-                pass
-            return
+                return
 
-        # Handle session dragging to shift all frames in that session
-        if self._dragging_session_id is not None and self._session_drag_start_x is not None:
-            try:
+            # Handle session dragging to shift all frames in that session
+            if self._dragging_session_id is not None and self._session_drag_start_x is not None:
                 cur_x = self.canvas.canvasx(event.x)
-                delta_px = cur_x - float(self._session_drag_start_x)
-                delta_t = delta_px / float(self.zoom_level if self.zoom_level else 1.0)
-            except Exception:
-                delta_t = 0.0
-            # Apply delta to all frames in the session (non-destructive for others)
-            try:
-                sid = self._dragging_session_id
-                idx = 0
-                for e in self.timeline_data:
-                    if e.get('session', 1) == sid:
-                        try:
-                            original_t = self._session_times_snapshot[idx] if self._session_times_snapshot and idx < len(self._session_times_snapshot) else e.get('t', 0.0)
-                        except Exception:
-                            original_t = e.get('t', 0.0)
-                        new_t = max(0.0, float(original_t) + float(delta_t))
-                        e['t'] = new_t
-                        idx += 1
-            except Exception:
-                pass
-            # Do not move playhead during session drag
-            self.waveform_cached = False
-            self._update_canvas_view()
-            return
+                delta_t = (cur_x - float(self._session_drag_start_x)) / float(zoom)
+                # Apply delta to all frames in the session (non-destructive for others)
+                snapshot = self._session_times_snapshot
+                indices = self._session_drag_indices
+                if snapshot is not None and indices is not None and not self._session_drag_list_intact():
+                    # The list was replaced or shortened under the drag; its indices no longer apply
+                    snapshot = indices = None
+                    self._session_times_snapshot = self._session_drag_indices = None
+                    self._t_arr = self._s_arr = self._session_mask = None
+                    self._refresh_timeline_max_t()
+                if snapshot is not None and indices is not None:
+                    if self._t_arr is not None:
+                        # Shift the session's column entries in one masked update; the column is
+                        # what gets drawn until release writes it back to the event dicts
+                        new_ts = np.maximum(0.0, snapshot + delta_t)
+                        self._t_arr[self._session_mask] = new_ts
+                        self._timeline_max_t = max(self._other_sessions_max_t, float(new_ts.max()) if len(new_ts) else 0.0)
+                    else:
+                        data = self.timeline_data
+                        for i, t in zip(indices, snapshot):
+                            data[i]['t'] = max(0.0, t + delta_t)
+                        self._refresh_timeline_max_t()
+                # Do not move playhead during session drag
+                self.waveform_cached = False
+                self._request_redraw()
+                return
 
-        # Handle loop handle dragging
-        if getattr(self, "_dragging_loop_in", False) or getattr(self, "_dragging_loop_out", False):
-            canvas_x = self.canvas.canvasx(event.x)
-            new_t = max(0.0, canvas_x / self.zoom_level)
-            # Snap to bounds: ensure loop_start < loop_end and maintain minimal width
-            min_gap = 0.05
-            try:
-                if getattr(self, "_dragging_loop_in", False):
+            # Handle loop handle dragging
+            if self._dragging_loop_in or self._dragging_loop_out:
+                canvas_x = self.canvas.canvasx(event.x)
+                new_t = max(0.0, canvas_x / zoom)
+                # Snap to bounds: ensure loop_start < loop_end and maintain minimal width
+                min_gap = 0.05
+                old_start, old_end = self.loop_start, self.loop_end
+                if self._dragging_loop_in:
                     self.loop_start = min(new_t, self.loop_end - min_gap)
                 else:
                     self.loop_end = max(new_t, self.loop_start + min_gap)
                 self.loop_enabled = True
-            except Exception:
-                pass
-            self.waveform_cached = False
-            self._update_canvas_view()
-            return
+                self._mark_dirty_band(old_start, old_end, self.loop_start, self.loop_end)
+                self._request_redraw()
+                return
 
-        # Handle MIDI marker dragging
-        if self.drag_midi_index is not None and self._drag_midi_ref is not None:
-            try:
+            # Handle MIDI marker dragging
+            if self.drag_midi_index is not None and self._drag_midi_ref is not None:
                 canvas_x = self.canvas.canvasx(event.x)
-                new_t = max(0.0, (canvas_x / self.zoom_level) - float(self._midi_drag_dt))
-            except Exception:
-                new_t = max(0.0, self.playhead_pos)
-            # Apply new time to the dragged marker
-            try:
-                self._drag_midi_ref["t"] = new_t
-            except Exception:
-                pass
-            # Re-sort markers and update selected index to the dragged item
-            try:
+                new_t = max(0.0, (canvas_x / zoom) - float(self._midi_drag_dt))
+                # Apply new time to the dragged marker
                 ref = self._drag_midi_ref
-                self.midi_markers.sort(key=lambda m: m.get("t", 0.0))
-                self.selected_midi_marker = self.midi_markers.index(ref)
-            except Exception:
-                pass
-            # Keep playhead fixed during marker drag
-            self.waveform_cached = False
-            self._update_canvas_view()
-            return
+                old_t = ref.get("t", 0.0)
+                ref["t"] = new_t
+                # Re-sort markers and update selected index only if the marker passed a neighbour
+                if not (self._drag_left_neighbor_t <= new_t <= self._drag_right_neighbor_t):
+                    self.midi_markers.sort(key=lambda m: m.get("t", 0.0))
+                    self.selected_midi_marker = self.midi_markers.index(ref)
+                    self._drag_left_neighbor_t, self._drag_right_neighbor_t = self._marker_neighbor_times(self.midi_markers, self.selected_midi_marker)
+                # Keep playhead fixed during marker drag
+                self._mark_dirty_band(old_t, new_t)
+                self._request_redraw()
+                return
 
-        # Handle OSC marker dragging
-        if self.drag_osc_index is not None and self._drag_osc_ref is not None:
-            try:
+            # Handle OSC marker dragging
+            if self.drag_osc_index is not None and self._drag_osc_ref is not None:
                 canvas_x = self.canvas.canvasx(event.x)
-                new_t = max(0.0, (canvas_x / self.zoom_level) - float(self._osc_drag_dt))
-            except Exception:
-                new_t = max(0.0, self.playhead_pos)
-            try:
-                self._drag_osc_ref["t"] = new_t
-            except Exception:
-                pass
-            try:
+                new_t = max(0.0, (canvas_x / zoom) - float(self._osc_drag_dt))
                 ref = self._drag_osc_ref
-                self.osc_markers.sort(key=lambda m: m.get("t", 0.0))
-                self.selected_osc_marker = self.osc_markers.index(ref)
-            except Exception:
-                pass
-            # Keep playhead fixed during OSC marker drag
-            self.waveform_cached = False
-            self._update_canvas_view()
-            return
-        
-        # Initialize drag tracking on first motion
-        if self.drag_start is None:
-            self.drag_start = (self.canvas.canvasx(event.x), self.canvas.canvasy(event.y))
-            self.is_dragging = False
-            return
-        
-        # Check if we've moved enough to be considered a drag
-        start_x, start_y = self.drag_start
-        cur_x, cur_y = self.canvas.canvasx(event.x), self.canvas.canvasy(event.y)
-        distance = ((cur_x - start_x)**2 + (cur_y - start_y)**2)**0.5
-        
-        if not self.is_dragging and distance < self.drag_threshold_distance:
-            return  # Not enough movement yet
-        
-        self.is_dragging = True
-        
-        # Delete previous zoom box if exists
-        if self.zoom_box_id is not None:
-            self.canvas.delete(self.zoom_box_id)
-        
-        # Draw zoom selection box
-        self.zoom_box_id = self.canvas.create_rectangle(
-            start_x, start_y, cur_x, cur_y,
-            outline="yellow", width=2, dash=(4, 4)
-        )
+                old_t = ref.get("t", 0.0)
+                ref["t"] = new_t
+                if not (self._drag_left_neighbor_t <= new_t <= self._drag_right_neighbor_t):
+                    self.osc_markers.sort(key=lambda m: m.get("t", 0.0))
+                    self.selected_osc_marker = self.osc_markers.index(ref)
+                    self._drag_left_neighbor_t, self._drag_right_neighbor_t = self._marker_neighbor_times(self.osc_markers, self.selected_osc_marker)
+                # Keep playhead fixed during OSC marker drag
+                self._mark_dirty_band(old_t, new_t)
+                self._request_redraw()
+                return
+            
+            # Initialize drag tracking on first motion
+            if self.drag_start is None:
+                self.drag_start = (self.canvas.canvasx(event.x), self.canvas.canvasy(event.y))
+                self.is_dragging = False
+                return
+            
+            # Check if we've moved enough to be considered a drag
+            start_x, start_y = self.drag_start
+            cur_x, cur_y = self.canvas.canvasx(event.x), self.canvas.canvasy(event.y)
+            distance = ((cur_x - start_x)**2 + (cur_y - start_y)**2)**0.5
+            
+            if not self.is_dragging and distance < self.drag_threshold_distance:
+                return  # Not enough movement yet
+            
+            self.is_dragging = True
+            
+            # Delete previous zoom box if exists
+            if self.zoom_box_id is not None:
+                self.canvas.delete(self.zoom_box_id)
+            
+            # Draw zoom selection box
+            self.zoom_box_id = self.canvas.create_rectangle(
+                start_x, start_y, cur_x, cur_y,
+                outline="yellow", width=2, dash=(4, 4)
+            )
+        except Exception:
+            pass
     
     def _on_canvas_release(self, event):
         """Handle mouse release to zoom into selected area or stop playhead dragging."""
@@ -5859,7 +6135,18 @@ class TimelineEditorGUI:
             sid = self._dragging_session_id
             self._dragging_session_id = None
             self._session_drag_start_x = None
+            # Write the dragged times back to the event dicts in one pass (skipped if an
+            # undo/redo or delete replaced or shortened the list mid-drag)
+            if self._t_arr is not None and self._session_drag_indices is not None and self._session_drag_list_intact():
+                data = self.timeline_data
+                indices = self._session_drag_indices
+                for i, t in zip(indices.tolist(), self._t_arr[indices].tolist()):
+                    data[i]['t'] = t
             self._session_times_snapshot = None
+            self._session_drag_indices = None
+            self._t_arr = self._s_arr = self._session_mask = None
+            self._other_sessions_max_t = 0.0
+            self._session_drag_data = None
             try:
                 self.canvas.config(cursor="crosshair")
             except Exception:
@@ -5877,7 +6164,7 @@ class TimelineEditorGUI:
             return
 
         # Stop loop handle dragging
-        if getattr(self, "_dragging_loop_in", False) or getattr(self, "_dragging_loop_out", False):
+        if self._dragging_loop_in or self._dragging_loop_out:
             self._dragging_loop_in = False
             self._dragging_loop_out = False
             try:
@@ -5885,7 +6172,7 @@ class TimelineEditorGUI:
             except Exception:
                 pass
             # Redraw to finalize positions
-            self.waveform_cached = False
+            self.markers_dirty = True
             self._update_canvas_view()
             return
 
@@ -5895,25 +6182,26 @@ class TimelineEditorGUI:
                 self.canvas.config(cursor="crosshair")
             except Exception:
                 pass
-            # Commit final sort and selection
+            # Commit final sort and selection (skipped when the marker stayed between its neighbours)
+            moved = False
             try:
                 ref = self._drag_midi_ref
-                self.midi_markers.sort(key=lambda m: m.get("t", 0.0))
-                if ref in self.midi_markers:
-                    self.selected_midi_marker = self.midi_markers.index(ref)
-            except Exception:
-                pass
-            # Mark dirty on position change
-            try:
-                self.is_dirty = True
+                moved = float(ref.get("t", 0.0)) != self._drag_press_t
+                if not (self._drag_left_neighbor_t <= ref.get("t", 0.0) <= self._drag_right_neighbor_t):
+                    self.midi_markers.sort(key=lambda m: m.get("t", 0.0))
+                    if ref in self.midi_markers:
+                        self.selected_midi_marker = self.midi_markers.index(ref)
             except Exception:
                 pass
             # Clear drag state
             self.drag_midi_index = None
             self._drag_midi_ref = None
             self._midi_drag_dt = 0.0
-            self.waveform_cached = False
-            self._update_canvas_view()
+            self._drag_press_t = None
+            # A plain click was already restyled on press; only a move needs repainting
+            if moved:
+                self.is_dirty = True
+                self._finish_marker_drag()
             # Do not treat as zoom selection
             self.drag_start = None
             self.is_dragging = False
@@ -5925,23 +6213,23 @@ class TimelineEditorGUI:
                 self.canvas.config(cursor="crosshair")
             except Exception:
                 pass
+            moved = False
             try:
                 ref = self._drag_osc_ref
-                self.osc_markers.sort(key=lambda m: m.get("t", 0.0))
-                if ref in self.osc_markers:
-                    self.selected_osc_marker = self.osc_markers.index(ref)
-            except Exception:
-                pass
-            # Mark dirty on position change
-            try:
-                self.is_dirty = True
+                moved = float(ref.get("t", 0.0)) != self._drag_press_t
+                if not (self._drag_left_neighbor_t <= ref.get("t", 0.0) <= self._drag_right_neighbor_t):
+                    self.osc_markers.sort(key=lambda m: m.get("t", 0.0))
+                    if ref in self.osc_markers:
+                        self.selected_osc_marker = self.osc_markers.index(ref)
             except Exception:
                 pass
             self.drag_osc_index = None
             self._drag_osc_ref = None
             self._osc_drag_dt = 0.0
-            self.waveform_cached = False
-            self._update_canvas_view()
+            self._drag_press_t = None
+            if moved:
+                self.is_dirty = True
+                self._finish_marker_drag()
             self.drag_start = None
             self.is_dragging = False
             return
@@ -6002,61 +6290,217 @@ class TimelineEditorGUI:
         # Scroll to bring the selection into view (centered on selection start)
         max_time_total = max(
             self.audio_duration if self.audio_data else 0,
-            max((evt.get("t", 0) for evt in self.timeline_data), default=0) if self.timeline_data else 0
+            self._timeline_max_t
         )
         total_width = int(max_time_total * self.zoom_level) + 100 if max_time_total > 0 else canvas_width
         canvas_visible = self.canvas.winfo_width()
         target_x = min_time * self.zoom_level
         if total_width > canvas_visible:
             target_scroll = max(0, min(1.0, (target_x - canvas_visible / 3) / (total_width - canvas_visible)))
-            self.canvas.xview_moveto(target_scroll)
+            self._scroll_to(target_scroll)
     
-    def _update_canvas_view(self):
-        """Redraw the timeline canvas with audio waveform, events, and playhead."""
-        # During playback/recording, only update playhead position (fast update)
-        if (self.is_playing or self.recording) and self.waveform_cached:
-            # Delete only the playhead from previous frame and redraw it
-            self.canvas.delete("playhead")
-            
-            canvas_height = self.canvas.winfo_height()
-            canvas_width = self.canvas.winfo_width()
-            
-            playhead_x = self.playhead_pos * self.zoom_level
-            
-            # Draw playhead
-            self.canvas.create_line(playhead_x, 0, playhead_x, canvas_height, fill="red", width=2, tags="playhead")
-            
-            # Auto-scroll to follow playhead
+    def _request_redraw(self, delay_ms=None):
+        """Schedule a single canvas redraw for the next idle turn, or after delay_ms.
+
+        Worker threads pass a frame-length delay so bursts of updates collapse
+        into one redraw per frame instead of queueing one each.
+        """
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            if delay_ms is None:
+                self.root.after_idle(self._do_redraw)
+            else:
+                self.root.after(delay_ms, self._do_redraw)
+
+    def _do_redraw(self):
+        """Run a redraw scheduled by `_request_redraw`."""
+        self._redraw_pending = False
+        self._update_canvas_view()
+
+    def _visible_x_range(self, margin=0):
+        """Return the (left, right) canvas x-coordinates currently in view, widened by margin."""
+        left = self.canvas.canvasx(0)
+        return left - margin, left + self.canvas.winfo_width() + margin
+
+    def _view_within_drawn_range(self):
+        """True if the visible area lies inside the x-range covered by the last full redraw."""
+        if self._drawn_x_range is None:
+            return False
+        left, right = self._visible_x_range()
+        return self._drawn_x_range[0] <= left and right <= self._drawn_x_range[1]
+
+    def _scroll_to(self, fraction):
+        """Scroll the timeline horizontally, redrawing if the view leaves the drawn range."""
+        self.canvas.xview_moveto(fraction)
+        if not self._view_within_drawn_range():
+            self._request_redraw()
+
+    def _on_canvas_configure(self, event=None):
+        """Redraw after a resize once the timeline has been drawn at least once."""
+        if self._drawn_x_range is not None:
+            # Layout depends on the canvas size, so a partial repaint is not enough
+            self.waveform_cached = False
+            self._request_redraw()
+
+    def _clear_canvas(self):
+        """Delete every canvas item except the pooled grid, marker and playhead items."""
+        self.canvas.addtag_all("stale")
+        self.canvas.dtag("grid", "stale")
+        self.canvas.dtag("pooled", "stale")
+        self.canvas.delete("stale")
+
+    def _pool_item(self, pool, kind, idx, coords, style=None, **options):
+        """Place item `idx` of a pool at `coords`, creating it with `style` when the pool is short."""
+        items = self._item_pools.setdefault(pool, {}).setdefault(kind, [])
+        if idx < len(items):
+            self.canvas.coords(items[idx], *coords)
+            self.canvas.itemconfigure(items[idx], state="normal", **options)
+        else:
+            style = dict(style or {})
+            tags = ("pooled", pool) + tuple(style.pop("tags", ()))
+            create = getattr(self.canvas, "create_" + kind)
+            items.append(create(*coords, tags=tags, **style, **options))
+
+    def _pool_finish(self, pool, used, first=0):
+        """Hide pool items past the first `used` and lift the pool above freshly drawn items."""
+        self._pool_spans[pool] = (first, used)
+        for items in self._item_pools.get(pool, {}).values():
+            for item in items[used:]:
+                self.canvas.itemconfigure(item, state="hidden")
+        self.canvas.tag_raise(pool)
+
+    def _layout_is_current(self):
+        """True if the canvas matches the current layout, so small changes can be applied in place."""
+        return self.waveform_cached and not self.markers_dirty and self._layout_key() == self._layout_cache_key
+
+    def _restyle_marker_selection(self, kind, old_idx, new_idx):
+        """Move the selected style between two drawn marker blocks without a redraw."""
+        rects = self._item_pools.get(kind + "_pool", {}).get("rectangle", [])
+        first, used = self._pool_spans.get(kind + "_pool", (0, 0))
+        normal, selected = _MARKER_SELECT_STYLES[kind]
+        # Markers outside the drawn range pick up their style on the next full draw
+        for idx, style in ((old_idx, normal), (new_idx, selected)):
+            if idx is not None and first <= idx < first + used:
+                self.canvas.itemconfigure(rects[idx - first], **style)
+        self._layout_cache_key = self._layout_key()
+
+    def _move_playhead_only(self):
+        """Advance the playhead on an unchanged layout; False if a full redraw is needed."""
+        canvas_height = self.canvas.winfo_height()
+        canvas_width = self.canvas.winfo_width()
+        
+        playhead_x = self.playhead_pos * self.zoom_level
+        self._place_playhead(canvas_height)
+        
+        # Auto-scroll to follow playhead
+        if self.is_playing or self.recording:
             max_time = max(
                 self.audio_duration if self.audio_data else 0,
-                max((evt.get("t", 0) for evt in self.timeline_data), default=0) if self.timeline_data else 0
+                self._timeline_max_t
             )
             total_width = int(max_time * self.zoom_level) + 100
             
             if total_width > canvas_width:
                 target_scroll = max(0, min(1.0, (playhead_x - canvas_width / 3) / (total_width - canvas_width)))
                 self.canvas.xview_moveto(target_scroll)
-            
-            self.playhead_label.config(text=self._format_time(self.playhead_pos))
-            try:
-                if hasattr(self, "monitor_timecode_label") and self.monitor_timecode_label:
-                    self.monitor_timecode_label.config(text=self._format_time(self.playhead_pos))
-            except Exception:
-                pass
+        
+        # Fall through to a full redraw once the view scrolls past the drawn range
+        if not self._view_within_drawn_range():
+            return False
+        time_text = self._format_time(self.playhead_pos)
+        self.playhead_label.config(text=time_text)
+        try:
+            if self.monitor_timecode_label:
+                self.monitor_timecode_label.config(text=time_text)
+        except Exception:
+            pass
+        return True
+
+    def _place_playhead(self, canvas_height):
+        """Move the single playhead line to playhead_pos and keep it on top."""
+        x = self.playhead_pos * self.zoom_level
+        if self._playhead_id is None:
+            self._playhead_id = self.canvas.create_line(x, 0, x, canvas_height, fill="red", width=2, tags=("playhead", "pooled"))
+        else:
+            self.canvas.coords(self._playhead_id, x, 0, x, canvas_height)
+            # Shown again after an empty timeline hid it
+            self.canvas.itemconfigure(self._playhead_id, state="normal")
+        self.canvas.tag_raise(self._playhead_id)
+
+    def _draw_grid(self, max_time, max_x, canvas_height):
+        """Position the pooled one-second grid lines over the visible range."""
+        zoom = self.zoom_level
+        x_lo, x_hi = self._drawn_x_range
+        first = max(0, int(x_lo // zoom))
+        last = min(int(max_time) + 1, int(x_hi // zoom) + 1)
+        ticks = [i for i in range(first, last + 1) if i * zoom <= max_x]
+        
+        # Grow the pool only when more ticks are visible than ever before
+        while len(self._grid_line_ids) < len(ticks):
+            self._grid_line_ids.append(self.canvas.create_line(0, 0, 0, 0, fill="gray20", dash=(4, 4), tags="grid"))
+            self._grid_text_ids.append(self.canvas.create_text(0, 0, text="", fill="gray50", anchor="nw", font=("mono", 8), tags="grid"))
+        
+        coords = self.canvas.coords
+        itemconfig = self.canvas.itemconfigure
+        for k, i in enumerate(ticks):
+            x = i * zoom
+            coords(self._grid_line_ids[k], x, 0, x, canvas_height)
+            itemconfig(self._grid_line_ids[k], state="normal")
+            coords(self._grid_text_ids[k], x + 5, 5)
+            itemconfig(self._grid_text_ids[k], text=f"{i}s", state="normal")
+        for k in range(len(ticks), len(self._grid_line_ids)):
+            itemconfig(self._grid_line_ids[k], state="hidden")
+            itemconfig(self._grid_text_ids[k], state="hidden")
+        # Keep the grid stacked just above the waveform drawn before it
+        self.canvas.tag_raise("grid")
+
+    def _layout_key(self):
+        """Cheap fingerprint of everything besides the playhead that affects the drawn layout."""
+        return (
+            self.zoom_level, self.canvas.winfo_width(), self.canvas.winfo_height(),
+            len(self.timeline_data) if self.timeline_data else 0, self._timeline_max_t,
+            self.audio_duration if self.audio_data else 0,
+            len(self.markers), len(self.osc_markers), len(self.midi_markers), len(self.smpte_markers),
+            self.selected_frame, self.selected_session, self.selected_osc_marker,
+            self.selected_midi_marker, self.selected_smpte_marker,
+            self.loop_enabled, self.loop_start, self.loop_end, self._edit_counter,
+        )
+
+    def _update_canvas_view(self):
+        """Redraw the timeline canvas with audio waveform, events, and playhead."""
+        # When the layout is unchanged since the last draw, only move the playhead (fast update)
+        if self.waveform_cached and not self.markers_dirty and self._layout_key() == self._layout_cache_key:
+            if self._move_playhead_only():
+                return
+        
+        # Marker drags inside the drawn range only need the overlay layer repainted
+        if self._dirty_regions and self.waveform_cached and self._dirty_regions_within_drawn_range():
+            self._redraw_overlay()
             return
         
         # Full redraw when stopped or first load
-        self.canvas.delete("all")
+        self._clear_canvas()
         
         canvas_width = self.canvas.winfo_width()
         canvas_height = self.canvas.winfo_height()
         
         max_time = max(
             self.audio_duration if self.audio_data else 0,
-            max((evt.get("t", 0) for evt in self.timeline_data), default=0) if self.timeline_data else 0
+            self._timeline_max_t
         )
         
         if max_time == 0:
+            # Nothing to lay out: hide every pooled item (grid, sessions, markers, playhead)
+            # and forget their boxes so clicks don't hit what is no longer shown
+            self.canvas.itemconfigure("pooled", state="hidden")
+            self.canvas.itemconfigure("grid", state="hidden")
+            self._pool_spans = {}
+            self.frame_boxes = {}
+            self.session_bounds = {}
+            self.osc_marker_boxes = {}
+            self.midi_marker_boxes = {}
+            self.smpte_marker_boxes = {}
+            self._build_hit_grid()
             self.canvas.create_text(50, 20, text="No content loaded (add markers or audio)", fill="white", anchor="nw")
             return
         
@@ -6077,19 +6521,12 @@ class TimelineEditorGUI:
         self.duration_label.config(text=self._format_time(max_time))
         self.playhead_label.config(text=self._format_time(self.playhead_pos))
         try:
-            if hasattr(self, "monitor_timecode_label") and self.monitor_timecode_label:
+            if self.monitor_timecode_label:
                 self.monitor_timecode_label.config(text=self._format_time(self.playhead_pos))
         except Exception:
             pass
         self.events_label.config(text=str(len(self.timeline_data) if self.timeline_data else 0))
         
-        # Update loop status indicator
-        if self.loop_enabled and self.loop_end > self.loop_start:
-            loop_text = f"🔁 LOOP: {self._format_time(self.loop_start)} - {self._format_time(self.loop_end)}"
-            self.loop_label.config(text=loop_text, foreground="lime")
-        else:
-            self.loop_label.config(text="")
-        
         if self.audio_data:
             self._draw_waveform(canvas_width, canvas_height, max_time)
         
@@ -6097,12 +6534,9 @@ class TimelineEditorGUI:
         max_x = int(max_time * self.zoom_level) + 100
         self.canvas.config(scrollregion=(0, 0, max_x, canvas_height))
         
-        for i in range(0, int(max_time) + 2):
-            x = i * self.zoom_level
-            if x > max_x:
-                break
-            self.canvas.create_line(x, 0, x, canvas_height, fill="gray20", dash=(4, 4))
-            self.canvas.create_text(x + 5, 5, text=f"{i}s", fill="gray50", anchor="nw", font=("mono", 8))
+        # Draw one extra screen width either side so short scrolls need no redraw
+        self._drawn_x_range = self._visible_x_range(margin=canvas_width)
+        self._draw_grid(max_time, max_x, canvas_height)
         
         if self.timeline_data:
             # Position sessions and universes just below the waveform area
@@ -6116,7 +6550,6 @@ class TimelineEditorGUI:
             # First pass: gather sessions and universes per session preserving order
             session_order = []
             session_universes = {}
-            palette = ["cyan", "magenta", "yellow", "orange", "lime", "deeppink", "deepskyblue", "violet"]
             for evt in self.timeline_data:
                 s_id = evt.get("session", 1)
                 universe = evt.get("universe", 0)
@@ -6139,75 +6572,110 @@ class TimelineEditorGUI:
                 for s_id in session_order
             }
             
+            # Session colours are constant per session, so look them up once
+            palette = self.session_palette
+            session_color_map = {s_id: palette[(s_id - 1) % len(palette)] for s_id in session_order}
+            
             # Track session bounds for box drawing
             session_bounds = {s_id: [float('inf'), float('-inf'), float('inf'), float('-inf')] for s_id in session_order}
             
             self.frame_boxes = {}  # Reset frame boxes for selection tracking
             max_y_drawn = canvas_height
+            # Large timelines blit their frame blocks into a single image over the drawn range
+            use_image = HAS_PIL and len(self.timeline_data) >= _FRAME_IMAGE_MIN_FRAMES
+            image_rects = []
+            x_lo, x_hi = self._drawn_x_range
+            labelled_rows = set()
+            
+            # Bind loop invariants to locals for the per-frame loop
+            create_rect = self.canvas.create_rectangle
+            create_text = self.canvas.create_text
+            frame_boxes = self.frame_boxes
+            zl = self.zoom_level
+            selected_frame = self.selected_frame
+            label_x = canvas_width - 100
+            # Frame block size (larger for better clickability)
+            block_width = max(8, zl // 10)
+            block_height = 14
+            # Mid session-drag the time column is current; the dicts are updated on release
+            # Frames appended since the drag started (live capture) are not in the column
+            frame_times = self._t_arr.tolist() if self._t_arr is not None and self._session_drag_list_intact() else []
+            n_times = len(frame_times)
             
             for frame_idx, evt in enumerate(self.timeline_data):
                 universe = evt.get("universe", 0)
-                opcode = evt.get("opcode", 80)
-                time_val = evt.get("t", 0)
                 session_id = evt.get("session", 1)
-                x = time_val * self.zoom_level
+                x = (frame_times[frame_idx] if frame_idx < n_times else evt.get("t", 0)) * zl
                 
                 # Row within this session
-                universe_idx_map = session_universe_index.get(session_id, {})
-                row_idx = universe_idx_map.get(universe, 0)
+                row_idx = session_universe_index.get(session_id, {}).get(universe, 0)
                 y = session_rows.get(session_id, base_y) + row_idx * row_spacing
+                bx1 = x - block_width
+                bx2 = x + block_width
+                by1 = y - block_height
+                by2 = y + block_height
                 
                 # Colors
-                base_color = palette[row_idx % len(palette)]
-                session_color = self.session_palette[(session_id - 1) % len(self.session_palette)] if hasattr(self, "session_palette") else base_color
-                color = session_color if opcode == 80 else "orange"
+                session_color = session_color_map[session_id]
+                color = session_color if evt.get("opcode", 80) == 80 else "orange"
                 
-                # Determine if this frame is selected
-                is_selected = (self.selected_frame == frame_idx)
-                
-                # Draw frame block (larger for better clickability)
-                block_width = max(8, self.zoom_level // 10)
-                block_height = 14
-                outline_color = "white" if is_selected else session_color
-                self.canvas.create_rectangle(
-                    x - block_width, y - block_height, x + block_width, y + block_height,
-                    fill=color, outline=outline_color, width=2 if is_selected else 1, tags=f"frame_{frame_idx}"
-                )
+                # Boxes are always recorded for bounds and hit-testing; only visible ones are drawn
+                if bx2 < x_lo or bx1 > x_hi:
+                    pass
+                elif selected_frame == frame_idx:
+                    create_rect(bx1, by1, bx2, by2, fill=color, outline="white", width=2, tags=f"frame_{frame_idx}")
+                elif use_image:
+                    image_rects.append((bx1, by1, bx2, by2, color, session_color))
+                else:
+                    create_rect(bx1, by1, bx2, by2, fill=color, outline=session_color, width=1, tags=f"frame_{frame_idx}")
                 
-                # Universe/session label at right side for clarity - moved to avoid overlapping session name
-                label_y = y
-                self.canvas.create_text(self.canvas.winfo_width() - 100, label_y, text=f"U{universe} S{session_id}", fill=session_color, anchor="e", font=("mono", 8))
+                # Universe/session label at right side for clarity, once per row
+                if (session_id, universe) not in labelled_rows:
+                    labelled_rows.add((session_id, universe))
+                    create_text(label_x, y, text=f"U{universe} S{session_id}", fill=session_color, anchor="e", font=("mono", 8))
                 
-                self.frame_boxes[frame_idx] = (x - block_width, y - block_height, x + block_width, y + block_height)
+                frame_boxes[frame_idx] = (bx1, by1, bx2, by2)
                 
                 # Update bounds for session box
                 b = session_bounds[session_id]
-                b[0] = min(b[0], x - block_width)
-                b[1] = max(b[1], x + block_width)
-                b[2] = min(b[2], y - block_height)
-                b[3] = max(b[3], y + block_height)
-                max_y_drawn = max(max_y_drawn, y + block_height)
+                if bx1 < b[0]:
+                    b[0] = bx1
+                if bx2 > b[1]:
+                    b[1] = bx2
+                if by1 < b[2]:
+                    b[2] = by1
+                if by2 > b[3]:
+                    b[3] = by2
+                if by2 > max_y_drawn:
+                    max_y_drawn = by2
+            
+            self._frames_photo = None
+            if image_rects:
+                self._draw_frames_image(image_rects)
             
             # Draw session bounding boxes
             padding = 10
+            n_boxes = 0
             for s_id in session_order:
                 b = session_bounds[s_id]
                 if b[0] == float('inf'):
                     continue
-                session_color = self.session_palette[(s_id - 1) % len(self.session_palette)] if hasattr(self, "session_palette") else "gray"
+                session_color = session_color_map[s_id]
                 outline_width = 3 if self.selected_session == s_id else 2
                 dash_style = () if self.selected_session == s_id else (6, 4)
-                self.canvas.create_rectangle(
-                    b[0] - padding, b[2] - padding, b[1] + padding, b[3] + padding,
-                    outline=session_color, dash=dash_style, width=outline_width
-                )
+                self._pool_item("session_pool", "rectangle", n_boxes,
+                                (b[0] - padding, b[2] - padding, b[1] + padding, b[3] + padding),
+                                outline=session_color, dash=dash_style, width=outline_width)
                 # Use custom name if available - position ABOVE the box for visibility
                 session_label = self.session_names.get(s_id, f"Session {s_id}")
                 # Place label above the box so it doesn't overlap with Art-Net data
                 label_x = max(b[0] - padding + 5, 5)  # Keep at least 5 pixels from left edge
                 label_y = b[2] - padding - 12  # Position above the top border of the box
-                self.canvas.create_text(label_x, label_y, text=session_label,
-                                        fill=session_color, anchor="sw", font=("mono", 9, "bold"))
+                self._pool_item("session_pool", "text", n_boxes, (label_x, label_y),
+                                style={"anchor": "sw", "font": ("mono", 9, "bold")},
+                                text=session_label, fill=session_color)
+                n_boxes += 1
+            self._pool_finish("session_pool", n_boxes)
             
             # Extend scrollregion height if needed
             if max_y_drawn + 80 > int(self.canvas.cget('height')):
@@ -6218,37 +6686,171 @@ class TimelineEditorGUI:
                 s_id: (b[0] - padding, b[1] + padding, b[2] - padding, b[3] + padding)
                 for s_id, b in session_bounds.items() if b[0] != float('inf')
             }
+        else:
+            # No frames: hide session boxes left from the previous layout
+            self._pool_finish("session_pool", 0)
+            self.frame_boxes = {}
+            self.session_bounds = {}
+        
+        self._draw_overlay(canvas_height, max_x)
+        
+        self._place_playhead(canvas_height)
+        
+        # Boxes are final for this layout; rebuild the hit-test index
+        self._build_hit_grid()
+        
+        self.waveform_cached = True  # Mark as cached after first full draw
+        self.markers_dirty = False
+        self._dirty_regions = []
+        self._layout_cache_key = self._layout_key()
+    
+    def _mark_dirty_band(self, *times):
+        """Record the canvas x-bands around marker times changed by a drag."""
+        zoom = self.zoom_level
+        for t in times:
+            x = t * zoom
+            self._dirty_regions.append((x - _DIRTY_BAND_PAD, x + _DIRTY_BAND_PAD))
+        self.markers_dirty = True
+        self._edit_counter += 1
+
+    def _dirty_regions_within_drawn_range(self):
+        """True if every dirty band and the visible area lie inside the last full redraw."""
+        if not self._view_within_drawn_range():
+            return False
+        lo, hi = self._drawn_x_range
+        return all(lo <= x1 and x2 <= hi for x1, x2 in self._dirty_regions)
+
+    def _finish_marker_drag(self):
+        """Repaint after a marker drag: the overlay alone when the drawn range still covers it."""
+        if self.waveform_cached and self._dirty_regions_within_drawn_range():
+            self._redraw_overlay()
+        else:
+            self.markers_dirty = True
+            self._update_canvas_view()
+
+    def _redraw_overlay(self):
+        """Repaint only the overlay layer, keeping waveform, grid and frames in place."""
+        canvas_height = self.canvas.winfo_height()
+        max_time = max(self.audio_duration if self.audio_data else 0, self._timeline_max_t)
+        max_x = int(max_time * self.zoom_level) + 100
+        self.canvas.delete("overlay")
+        self._draw_overlay(canvas_height, max_x)
+        self.canvas.tag_raise("playhead")
+        # Frames have not moved; re-index only the marker boxes
+        self._build_hit_grid(frames=False)
+        self.markers_dirty = False
+        self._dirty_regions = []
+        self._layout_cache_key = self._layout_key()
+
+    @staticmethod
+    def _place_lane_label(band_right, center, offset, below, x1, x2, est_h):
+        """Return a label baseline in a marker lane that avoids labels placed before it.
+
+        Labels are placed in time order, so one can only collide with the rightmost label
+        already on a baseline within est_h; `band_right` maps baseline -> right edge.
+        """
+        label_y = center + (offset if below else -offset)
+        for attempt in range(2):
+            hit = False
+            for band_y, right in band_right.items():
+                if right >= x1 and abs(band_y - label_y) <= est_h:
+                    hit = True
+                    break
+            if not hit:
+                break
+            if attempt == 0:
+                # Try the other side of the lane first, then a small nudge away from centre
+                below = not below
+                label_y = center + (offset if below else -offset)
+            else:
+                label_y += (10 if below else -10)
+        band_right[label_y] = max(band_right.get(label_y, x2), x2)
+        return label_y
+
+    @staticmethod
+    def _marker_range(markers, t_lo, t_hi, lead=0.0):
+        """Return the (lo, hi) slice of time-sorted `markers` starting within [t_lo - lead, t_hi]."""
+        key = lambda m: m.get("t", 0.0)
+        return bisect_left(markers, t_lo - lead, key=key), bisect_right(markers, t_hi, key=key)
+
+    def _marker_xs(self, lane, markers, t_lo, t_hi, default_duration=None):
+        """Return (lo, xs): the first index of `markers` in [t_lo, t_hi] and the x of each one in range.
+
+        Times (and the longest duration, for lanes whose blocks span one) are cached as
+        arrays per lane and rebuilt when the lane is edited, so culling is two searchsorted
+        calls and the x-coordinates one vector multiply.
+        """
+        zoom = self.zoom_level
+        if not HAS_NUMPY:
+            lead = 0.0
+            if default_duration is not None:
+                lead = max((float(m.get("duration", default_duration)) for m in markers), default=0.0)
+            lo, hi = self._marker_range(markers, t_lo, t_hi, lead)
+            return lo, [m.get("t", 0.0) * zoom for m in markers[lo:hi]]
+        key = (id(markers), len(markers), self._edit_counter)
+        cached = self._marker_time_cache.get(lane)
+        if cached is None or cached[0] != key:
+            times = np.array([m.get("t", 0.0) for m in markers], dtype=np.float64)
+            lead = 0.0
+            if default_duration is not None:
+                lead = max((float(m.get("duration", default_duration)) for m in markers), default=0.0)
+            cached = (key, times, lead)
+            self._marker_time_cache[lane] = cached
+        _, times, lead = cached
+        lo = int(np.searchsorted(times, t_lo - lead, side="left"))
+        hi = int(np.searchsorted(times, t_hi, side="right"))
+        return lo, (times[lo:hi] * zoom).tolist()
+
+    def _draw_overlay(self, canvas_height, max_x):
+        """Draw the loop region and marker lanes; every item is tagged "overlay"."""
+        # Update loop status indicator
+        if self.loop_enabled and self.loop_end > self.loop_start:
+            loop_text = f"🔁 LOOP: {self._format_time(self.loop_start)} - {self._format_time(self.loop_end)}"
+            self.loop_label.config(text=loop_text, foreground="lime")
+        else:
+            self.loop_label.config(text="")
+        
+        # Marker edits set markers_dirty; drop cached lane times so they are rebuilt
+        if self.markers_dirty:
+            self._marker_time_cache.clear()
+        
+        # Markers are kept sorted by time; draw only those inside this redraw's x-range
+        x_lo, x_hi = self._drawn_x_range or self._visible_x_range(margin=self.canvas.winfo_width())
+        t_lo = x_lo / self.zoom_level
+        t_hi = x_hi / self.zoom_level
         
         # Draw loop region
         if self.loop_enabled and self.loop_end > self.loop_start:
             loop_start_x = self.loop_start * self.zoom_level
             loop_end_x = self.loop_end * self.zoom_level
-            # Draw semi-transparent green region
-            self.canvas.create_rectangle(
+            # Green pre-blended onto the black background and kept beneath everything else;
+            # a stippled fill looks the same but is far slower for Tk to paint
+            loop_rect = self.canvas.create_rectangle(
                 loop_start_x, 0, loop_end_x, canvas_height,
-                fill="green", stipple="gray25", outline=""
+                fill=_LOOP_REGION_FILL, outline="", tags="overlay"
             )
+            self.canvas.tag_lower(loop_rect)
             # Draw loop boundaries
-            self.canvas.create_line(loop_start_x, 0, loop_start_x, canvas_height, fill="lime", width=3, tags=("loop_in_handle", "loop_handle"))
-            self.canvas.create_line(loop_end_x, 0, loop_end_x, canvas_height, fill="lime", width=3, tags=("loop_out_handle", "loop_handle"))
+            self.canvas.create_line(loop_start_x, 0, loop_start_x, canvas_height, fill="lime", width=3, tags=("loop_in_handle", "loop_handle", "overlay"))
+            self.canvas.create_line(loop_end_x, 0, loop_end_x, canvas_height, fill="lime", width=3, tags=("loop_out_handle", "loop_handle", "overlay"))
             # Draw loop labels
-            self.canvas.create_text(loop_start_x + 5, canvas_height - 20, text="LOOP IN", fill="lime", anchor="w", font=("Arial", 9, "bold"))
-            self.canvas.create_text(loop_end_x - 5, canvas_height - 20, text="LOOP OUT", fill="lime", anchor="e", font=("Arial", 9, "bold"))
+            self.canvas.create_text(loop_start_x + 5, canvas_height - 20, text="LOOP IN", fill="lime", anchor="w", font=("Arial", 9, "bold"), tags="overlay")
+            self.canvas.create_text(loop_end_x - 5, canvas_height - 20, text="LOOP OUT", fill="lime", anchor="e", font=("Arial", 9, "bold"), tags="overlay")
         
         # Draw markers
         if self.markers:
-            for marker in self.markers:
-                marker_x = marker["t"] * self.zoom_level
+            lo, xs = self._marker_xs("markers", self.markers, t_lo, t_hi)
+            for marker, marker_x in zip(self.markers[lo:lo + len(xs)], xs):
                 marker_label = marker["label"]
                 # Draw marker line
-                self.canvas.create_line(marker_x, 0, marker_x, canvas_height, fill="yellow", width=2, dash=(4, 4))
+                self.canvas.create_line(marker_x, 0, marker_x, canvas_height, fill="yellow", width=2, dash=(4, 4), tags="overlay")
                 # Draw marker label at top
-                self.canvas.create_text(marker_x + 3, 5, text=marker_label, fill="yellow", anchor="nw", font=("Arial", 8, "bold"))
+                self.canvas.create_text(marker_x + 3, 5, text=marker_label, fill="yellow", anchor="nw", font=("Arial", 8, "bold"), tags="overlay")
         
         # Draw MIDI markers section
         # Draw OSC markers section (above MIDI)
         # Draw SMPTE markers section (above OSC)
-        if getattr(self, 'smpte_markers', []):
+        if self.smpte_markers:
             smpte_section_height = 60
             # Place SMPTE above OSC/MIDI lanes
             has_osc = bool(self.osc_markers)
@@ -6263,42 +6865,42 @@ class TimelineEditorGUI:
 
             left_padding = 14
             self.canvas.create_rectangle(0, smpte_section_top, max_x, smpte_section_bottom,
-                                        fill="#0f0f0f", outline="#87cefa", width=2)
+                                        fill="#0f0f0f", outline="#87cefa", width=2, tags="overlay")
             self.canvas.create_text(left_padding, smpte_section_top - 22, text="SMPTE",
-                                   fill="#87cefa", anchor="nw", font=("Arial", 9, "bold"))
+                                   fill="#87cefa", anchor="nw", font=("Arial", 9, "bold"), tags="overlay")
 
             self.smpte_marker_boxes = {}
-            for idx, sm in enumerate(self.smpte_markers):
-                marker_x = sm.get("t", 0.0) * self.zoom_level
+            # Blocks span their duration, so include markers starting up to the longest one earlier
+            lo, xs = self._marker_xs("smpte", self.smpte_markers, t_lo, t_hi, default_duration=1.0)
+            hi = lo + len(xs)
+            for idx, marker_x in enumerate(xs, lo):
+                sm = self.smpte_markers[idx]
                 name = sm.get("name", "SMPTE")
                 duration = float(sm.get("duration", 1.0))
                 duration_width = max(8, duration * self.zoom_level)
                 block_height = 18
                 is_selected = (self.selected_smpte_marker == idx)
-                outline_color = "white" if is_selected else "#87cefa"
-                fill_color = "#4682b4" if is_selected else "#2f4f4f"
-                self.canvas.create_rectangle(
-                    marker_x - 2, smpte_center - block_height,
-                    marker_x + duration_width, smpte_center + block_height,
-                    fill=fill_color, outline=outline_color, width=2 if is_selected else 1,
-                    tags=f"smpte_{idx}"
-                )
-                self.canvas.create_line(marker_x, smpte_section_top, marker_x, smpte_section_bottom,
-                                       fill="#87cefa", width=2, dash=(2, 2))
+                self._pool_item("smpte_pool", "rectangle", idx - lo,
+                                (marker_x - 2, smpte_center - block_height, marker_x + duration_width, smpte_center + block_height),
+                                **_MARKER_SELECT_STYLES["smpte"][is_selected])
+                self._pool_item("smpte_pool", "line", idx - lo, (marker_x, smpte_section_top, marker_x, smpte_section_bottom),
+                                style={"fill": "#87cefa", "width": 2, "dash": (2, 2)})
                 # Label
                 info = name
                 max_label_chars = 18
                 if len(info) > max_label_chars:
                     info = info[:max_label_chars-1] + "…"
                 label_y = smpte_center - (block_height + 10)
-                self.canvas.create_text(marker_x, label_y, text=info,
-                                       fill="white", anchor="w", font=("Arial", 7, "bold"))
+                self._pool_item("smpte_pool", "text", idx - lo, (marker_x, label_y),
+                                style={"fill": "white", "anchor": "w", "font": ("Arial", 7, "bold")}, text=info)
                 self.smpte_marker_boxes[idx] = (
                     marker_x - 2, smpte_center - block_height,
                     marker_x + duration_width, smpte_center + block_height
                 )
+            self._pool_finish("smpte_pool", hi - lo, lo)
         else:
             self.smpte_marker_boxes = {}
+            self._pool_finish("smpte_pool", 0)
 
         if self.osc_markers:
             osc_section_height = 80
@@ -6327,68 +6929,44 @@ class TimelineEditorGUI:
             # Draw section background and label: place label ABOVE the lane like Art-Net sessions
             left_padding = 14
             self.canvas.create_rectangle(0, osc_section_top, max_x, osc_section_bottom,
-                                        fill="#111111", outline="deepskyblue", width=2)
+                                        fill="#111111", outline="deepskyblue", width=2, tags="overlay")
             self.canvas.create_text(left_padding, osc_section_top - 22, text="OSC Markers",
-                                   fill="deepskyblue", anchor="nw", font=("Arial", 9, "bold"))
+                                   fill="deepskyblue", anchor="nw", font=("Arial", 9, "bold"), tags="overlay")
 
             # Track OSC marker bounds for click selection
             self.osc_marker_boxes = {}
-            # Track placed label boxes to avoid overlap
-            placed_osc_labels = []  # list of (x1,y1,x2,y2)
+            # Rightmost placed label edge per baseline, to avoid overlap
+            osc_label_right = {}
 
-            for idx, osc in enumerate(self.osc_markers):
-                marker_x = osc.get("t", 0.0) * self.zoom_level
+            lo, xs = self._marker_xs("osc", self.osc_markers, t_lo, t_hi)
+            hi = lo + len(xs)
+            for idx, marker_x in enumerate(xs, lo):
+                osc = self.osc_markers[idx]
                 name = osc.get("name", "OSC")
                 address = osc.get("address", "/")
                 # Draw a fixed-size block (match MIDI marker height/visual size)
                 block_width = 20
                 block_height = 20
                 is_selected = (self.selected_osc_marker == idx)
-                outline_color = "white" if is_selected else "deepskyblue"
-                fill_color = "dodgerblue" if is_selected else "steelblue"
-                self.canvas.create_rectangle(
-                    marker_x - 2, osc_section_center - block_height,
-                    marker_x + block_width, osc_section_center + block_height,
-                    fill=fill_color, outline=outline_color, width=2 if is_selected else 1,
-                    tags=f"osc_{idx}"
-                )
+                self._pool_item("osc_pool", "rectangle", idx - lo,
+                                (marker_x - 2, osc_section_center - block_height, marker_x + block_width, osc_section_center + block_height),
+                                **_MARKER_SELECT_STYLES["osc"][is_selected])
                 # Vertical line
-                self.canvas.create_line(marker_x, osc_section_top, marker_x, osc_section_bottom,
-                                       fill="deepskyblue", width=2, dash=(2, 2))
+                self._pool_item("osc_pool", "line", idx - lo, (marker_x, osc_section_top, marker_x, osc_section_bottom),
+                                style={"fill": "deepskyblue", "width": 2, "dash": (2, 2)})
                 # Label with name (stagger + collision flip)
                 info = name if name else "OSC"
                 # Basic truncation to avoid extremely long overflow
                 max_label_chars = 18
                 if len(info) > max_label_chars:
                     info = info[:max_label_chars-1] + "…"
-                # Alternating baseline: even below, odd above
-                below = (idx % 2 == 0)
-                label_y = osc_section_center + (block_height + 10 if below else -(block_height + 10))
+                # Alternating baseline: even below, odd above, flipped/nudged on collision
                 label_x = marker_x
-                # Compute tentative bounding box (approximate width)
                 # Assume ~7px per char at this font size
                 est_w = max(20, 7 * len(info))
                 est_h = 12
-                def overlaps(x1,y1,x2,y2, boxes):
-                    for (ax1,ay1,ax2,ay2) in boxes:
-                        if not (x2 < ax1 or x1 > ax2 or y2 < ay1 or y1 > ay2):
-                            return True
-                    return False
-                # Try flip if overlapping
-                x1 = label_x
-                y1 = label_y - est_h
-                x2 = label_x + est_w
-                y2 = label_y
-                if overlaps(x1,y1,x2,y2, placed_osc_labels):
-                    below = not below
-                    label_y = osc_section_center + (block_height + 10 if below else -(block_height + 10))
-                    y1 = label_y - est_h
-                    y2 = label_y
-                # Final small vertical nudge if still overlapping
-                if overlaps(x1,y1,x2,y2, placed_osc_labels):
-                    label_y += (10 if below else -10)
-                    y1 = label_y - est_h
-                    y2 = label_y
+                label_y = self._place_lane_label(osc_label_right, osc_section_center, block_height + 10,
+                                                 idx % 2 == 0, label_x, label_x + est_w, est_h)
                 # Clamp label inside lane vertically
                 try:
                     min_cy = osc_section_top + 6 + est_h/2
@@ -6399,15 +6977,16 @@ class TimelineEditorGUI:
                         label_y = max_cy
                 except Exception:
                     pass
-                self.canvas.create_text(label_x, label_y, text=info,
-                                       fill="white", anchor="w", font=("Arial", 7, "bold"))
-                placed_osc_labels.append((label_x, y1, x2, y2))
+                self._pool_item("osc_pool", "text", idx - lo, (label_x, label_y),
+                                style={"fill": "white", "anchor": "w", "font": ("Arial", 7, "bold")}, text=info)
                 self.osc_marker_boxes[idx] = (
                     marker_x - 2, osc_section_center - block_height,
                     marker_x + block_width, osc_section_center + block_height
                 )
+            self._pool_finish("osc_pool", hi - lo, lo)
         else:
             self.osc_marker_boxes = {}
+            self._pool_finish("osc_pool", 0)
 
         # Draw MIDI markers section
         if self.midi_markers:
@@ -6420,17 +6999,20 @@ class TimelineEditorGUI:
             # Draw section background and label: place label ABOVE the lane like Art-Net sessions
             left_padding = 14
             self.canvas.create_rectangle(0, midi_section_top, max_x, midi_section_bottom,
-                                        fill="gray15", outline="purple", width=2)
+                                        fill="gray15", outline="purple", width=2, tags="overlay")
             self.canvas.create_text(left_padding, midi_section_top - 22, text="MIDI Markers", 
-                                   fill="mediumpurple", anchor="nw", font=("Arial", 9, "bold"))
+                                   fill="mediumpurple", anchor="nw", font=("Arial", 9, "bold"), tags="overlay")
             
             # Track MIDI marker bounds for click selection
             self.midi_marker_boxes = {}
-            placed_midi_labels = []
+            midi_label_right = {}
             
             # Draw each MIDI marker
-            for idx, midi_marker in enumerate(self.midi_markers):
-                marker_x = midi_marker["t"] * self.zoom_level
+            # Blocks span their duration, so include markers starting up to the longest one earlier
+            lo, xs = self._marker_xs("midi", self.midi_markers, t_lo, t_hi, default_duration=0.1)
+            hi = lo + len(xs)
+            for idx, marker_x in enumerate(xs, lo):
+                midi_marker = self.midi_markers[idx]
                 note = midi_marker["note"]
                 velocity = midi_marker["velocity"]
                 channel = midi_marker["channel"]
@@ -6443,20 +7025,15 @@ class TimelineEditorGUI:
                 
                 # Determine if this marker is selected
                 is_selected = (self.selected_midi_marker == idx)
-                outline_color = "white" if is_selected else "purple"
-                fill_color = "magenta" if is_selected else "mediumpurple"
                 
                 # Draw block
-                self.canvas.create_rectangle(
-                    marker_x - 2, midi_section_center - block_height, 
-                    marker_x + duration_width, midi_section_center + block_height,
-                    fill=fill_color, outline=outline_color, width=2 if is_selected else 1,
-                    tags=f"midi_{idx}"
-                )
+                self._pool_item("midi_pool", "rectangle", idx - lo,
+                                (marker_x - 2, midi_section_center - block_height, marker_x + duration_width, midi_section_center + block_height),
+                                **_MARKER_SELECT_STYLES["midi"][is_selected])
                 
                 # Draw vertical marker line
-                self.canvas.create_line(marker_x, midi_section_top, marker_x, midi_section_bottom,
-                                       fill="purple", width=2, dash=(2, 2))
+                self._pool_item("midi_pool", "line", idx - lo, (marker_x, midi_section_top, marker_x, midi_section_bottom),
+                                style={"fill": "purple", "width": 2, "dash": (2, 2)})
                 
                 # Label with MIDI info (stagger + collision flip)
                 info_text = f"N{note}"
@@ -6465,29 +7042,11 @@ class TimelineEditorGUI:
                 max_label_chars = 18
                 if len(info_text) > max_label_chars:
                     info_text = info_text[:max_label_chars-1] + "…"
-                below = (idx % 2 == 0)
-                label_y = midi_section_center + (block_height + 10 if below else -(block_height + 10))
                 label_x = marker_x
                 est_w = max(20, 7 * len(info_text))
                 est_h = 12
-                def overlaps_m(x1,y1,x2,y2):
-                    for (ax1,ay1,ax2,ay2) in placed_midi_labels:
-                        if not (x2 < ax1 or x1 > ax2 or y2 < ay1 or y1 > ay2):
-                            return True
-                    return False
-                x1 = label_x
-                y1 = label_y - est_h
-                x2 = label_x + est_w
-                y2 = label_y
-                if overlaps_m(x1,y1,x2,y2):
-                    below = not below
-                    label_y = midi_section_center + (block_height + 10 if below else -(block_height + 10))
-                    y1 = label_y - est_h
-                    y2 = label_y
-                if overlaps_m(x1,y1,x2,y2):
-                    label_y += (10 if below else -10)
-                    y1 = label_y - est_h
-                    y2 = label_y
+                label_y = self._place_lane_label(midi_label_right, midi_section_center, block_height + 10,
+                                                 idx % 2 == 0, label_x, label_x + est_w, est_h)
                 # Clamp label inside lane vertically
                 try:
                     min_cy = midi_section_top + 6 + est_h/2
@@ -6498,51 +7057,20 @@ class TimelineEditorGUI:
                         label_y = max_cy
                 except Exception:
                     pass
-                self.canvas.create_text(label_x, label_y, text=info_text,
-                                       fill="mediumpurple", anchor="w", font=("Arial", 7, "bold"))
-                placed_midi_labels.append((label_x, y1, x2, y2))
+                self._pool_item("midi_pool", "text", idx - lo, (label_x, label_y),
+                                style={"fill": "mediumpurple", "anchor": "w", "font": ("Arial", 7, "bold")}, text=info_text)
                 
                 # Store bounds for click detection
                 self.midi_marker_boxes[idx] = (
                     marker_x - 2, midi_section_center - block_height,
                     marker_x + duration_width, midi_section_center + block_height
                 )
+            self._pool_finish("midi_pool", hi - lo, lo)
         else:
             # Initialize empty if no MIDI markers
             self.midi_marker_boxes = {}
+            self._pool_finish("midi_pool", 0)
 
-            # Tooltip on hover for OSC markers
-            def _maybe_show_osc_tooltip(event=None):
-                try:
-                    cx = self.canvas.canvasx(event.x)
-                    cy = self.canvas.canvasy(event.y)
-                    if hasattr(self, 'osc_marker_boxes') and self.osc_marker_boxes:
-                        for idx, (x1, y1, x2, y2) in self.osc_marker_boxes.items():
-                            if x1 <= cx <= x2 and y1 <= cy <= y2 and 0 <= idx < len(self.osc_markers):
-                                m = self.osc_markers[idx]
-                                txt = f"{m.get('name','OSC')}\n{m.get('ip','')}:{m.get('port',0)}\n{m.get('address','/')} {m.get('args', [])}"
-                                # Use absolute screen coords for tooltip placement
-                                self._show_osc_tooltip(self.root.winfo_pointerx(), self.root.winfo_pointery(), txt)
-                                return
-                    self._hide_osc_tooltip()
-                except Exception:
-                    pass
-
-            try:
-                self.canvas.bind('<Motion>', _maybe_show_osc_tooltip)
-            except Exception:
-                pass
-        
-        # Ensure only one playhead is visible
-        try:
-            self.canvas.delete("playhead")
-        except Exception:
-            pass
-        playhead_x = self.playhead_pos * self.zoom_level
-        self.canvas.create_line(playhead_x, 0, playhead_x, canvas_height, fill="red", width=2, tags="playhead")
-        
-        self.waveform_cached = True  # Mark as cached after first full draw
-    
     def _draw_waveform(self, canvas_width, canvas_height, max_time):
         """Draw audio waveform on the canvas."""
         if not self.audio_data or len(self.audio_data) == 0:
@@ -6561,11 +7089,29 @@ class TimelineEditorGUI:
         self.canvas.create_line(0, waveform_center, total_width, waveform_center, 
                                fill="gray50", dash=(2, 2))
         
-        # Draw waveform across entire timeline
-        for i in range(0, total_width, 2):
+        # Place the cached waveform image as a single canvas item when possible
+        photo = self._get_waveform_image(canvas_height)
+        if photo is not None:
+            self.canvas.create_image(0, waveform_y_top, image=photo, anchor="nw", tags="waveform")
+            return
+        
+        # Too wide for an image: draw lines over the range this redraw covers only
+        x_lo, x_hi = self._visible_x_range(margin=canvas_width)
+        start = max(0, int(x_lo) // 2 * 2)
+        end = min(total_width, int(max_time * self.zoom_level) + 1, int(x_hi) + 1)
+        if start >= end:
+            return
+        if self._waveform_pyramid and self.audio_duration > 0:
+            xs = np.arange(start, end, 2)
+            lows, highs = self._waveform_peaks(xs, 2)
+            half = waveform_height / 2
+            create_line = self.canvas.create_line
+            for i, lo, hi in zip(xs.tolist(), (waveform_center + lows * half).tolist(), (waveform_center + highs * half).tolist()):
+                create_line(i, lo, i, hi + 1, fill="cyan", width=1)
+            return
+        
+        for i in range(start, end, 2):
             time_at_pixel = i / self.zoom_level
-            if time_at_pixel > max_time:
-                break
             
             sample_idx = int((time_at_pixel / self.audio_duration) * len(self.audio_data)) if self.audio_duration > 0 else 0
             sample_idx = max(0, min(sample_idx, len(self.audio_data) - 1))
@@ -6577,6 +7123,98 @@ class TimelineEditorGUI:
             y = waveform_center + y_offset
             
             self.canvas.create_line(i, waveform_center, i, y, fill="cyan", width=1)
+
+    def _prepare_audio_arrays(self):
+        """Reset waveform caches and rebuild the int16 samples and their peak pyramid."""
+        self._waveform_cache = {}
+        self._waveform_pyramid = []
+        if HAS_NUMPY and self.audio_data:
+            self._audio_arr = np.asarray(self.audio_data, dtype=np.int16)
+        else:
+            self._audio_arr = None
+            return
+        # Halve the resolution per level so any zoom reads about one bucket per pixel
+        mins = maxs = self._audio_arr
+        self._waveform_pyramid.append((mins, maxs))
+        while len(mins) > 512:
+            even = len(mins) // 2 * 2
+            mins = np.minimum(mins[0:even:2], mins[1:even:2])
+            maxs = np.maximum(maxs[0:even:2], maxs[1:even:2])
+            self._waveform_pyramid.append((mins, maxs))
+
+    def _waveform_peaks(self, xs, step):
+        """Return normalised (min, max) peaks for columns at canvas x `xs`, each `step` px wide."""
+        samples_per_col = len(self._audio_arr) / (self.zoom_level * self.audio_duration) * step
+        level = int(samples_per_col).bit_length() - 1 if samples_per_col >= 1 else 0
+        level = min(level, len(self._waveform_pyramid) - 1)
+        mins, maxs = self._waveform_pyramid[level]
+        scale = samples_per_col / step / (1 << level)
+        starts = (xs * scale).astype(np.intp)
+        np.clip(starts, 0, len(mins) - 1, out=starts)
+        # Slice so the last column's reduction stops at its own right edge
+        stop = min(len(mins), max(int((xs[-1] + step) * scale), int(starts[-1]) + 1))
+        lows = np.minimum.reduceat(mins[:stop], starts) / 32768.0
+        highs = np.maximum.reduceat(maxs[:stop], starts) / 32768.0
+        return lows, highs
+
+    def _draw_frames_image(self, rects):
+        """Render frame blocks into one image and place it on the canvas as a single item."""
+        x0 = int(min(r[0] for r in rects))
+        y0 = int(min(r[1] for r in rects))
+        x1 = int(max(r[2] for r in rects)) + 1
+        y1 = int(max(r[3] for r in rects)) + 1
+        img = Image.new("RGBA", (max(1, x1 - x0), max(1, y1 - y0)), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(img)
+        for bx1, by1, bx2, by2, fill, outline in rects:
+            draw.rectangle([bx1 - x0, by1 - y0, bx2 - x0, by2 - y0], fill=fill, outline=outline)
+        self._frames_photo = ImageTk.PhotoImage(img)
+        self.canvas.create_image(x0, y0, anchor="nw", image=self._frames_photo, tags="frames_img")
+        # The selected frame stays a canvas item; keep it above the image
+        if self.selected_frame is not None and self.canvas.find_withtag(f"frame_{self.selected_frame}"):
+            self.canvas.tag_lower("frames_img", f"frame_{self.selected_frame}")
+
+    def _get_waveform_image(self, canvas_height):
+        """Return a cached PhotoImage of the waveform for the current zoom, or None."""
+        if not HAS_PIL or self.audio_duration <= 0:
+            return None
+        key = (round(self.zoom_level, 2), canvas_height)
+        photo = self._waveform_cache.get(key)
+        if photo is not None:
+            return photo
+        
+        width = int(self.audio_duration * self.zoom_level) + 1
+        if width > _WAVEFORM_IMAGE_MAX_WIDTH:
+            return None
+        waveform_height = min(100, canvas_height // 3)
+        center = waveform_height / 2
+        n_samples = len(self.audio_data)
+        
+        if self._waveform_pyramid:
+            # Fill each pixel column between its min and max peak in one mask
+            xs = np.arange(width)
+            lows, highs = self._waveform_peaks(xs, 1)
+            rows = np.arange(waveform_height + 1)[:, None]
+            lo = np.floor(center + lows * center)
+            hi = np.ceil(center + highs * center)
+            rgba = np.zeros((waveform_height + 1, max(1, width), 4), dtype=np.uint8)
+            rgba[:, :, 1] = 255
+            rgba[:, :, 2] = 255
+            rgba[:, :, 3] = ((rows >= lo) & (rows <= hi)) * 255
+            img = Image.fromarray(rgba, "RGBA")
+        else:
+            img = Image.new("RGBA", (max(1, width), max(1, waveform_height + 1)), (0, 0, 0, 0))
+            draw = ImageDraw.Draw(img)
+            for i in range(0, width, 2):
+                sample_idx = int((i / self.zoom_level / self.audio_duration) * n_samples)
+                sample_idx = max(0, min(sample_idx, n_samples - 1))
+                sample = max(-1.0, min(1.0, self.audio_data[sample_idx] / 32768.0))
+                draw.line([(i, center), (i, center + sample * center)], fill="cyan", width=1)
+        
+        photo = ImageTk.PhotoImage(img)
+        self._waveform_cache[key] = photo
+        while len(self._waveform_cache) > _WAVEFORM_CACHE_SIZE:
+            self._waveform_cache.pop(next(iter(self._waveform_cache)))
+        return photo
     
     def _update_timeline_canvas(self):
         """Periodically update canvas (single scheduler)."""
@@ -6606,17 +7244,34 @@ class TimelineEditorGUI:
 
             sock.settimeout(1.0)
             
+            if HAS_NUMBA:
+                # Compile the diff kernel now rather than on the first captured packet
+                try:
+                    _diff_learned_channels(np.zeros(512, dtype=np.uint8), np.zeros(1, dtype=np.int32), np.zeros(1, dtype=np.uint8))
+                except Exception:
+                    pass
+            
             try:
                 while self.dmx_monitor_running:
                     try:
                         data, _ = sock.recvfrom(1024)
                         if data.startswith(b"Art-Net\x00"):
-                            universe = data[14] if len(data) > 14 else 0
-                            dmx_data = data[18:18+512] if len(data) > 18 else b""
+                            universe = _ARTNET_UNIVERSE.unpack_from(data, 14)[0] & 0x7FFF if len(data) >= 16 else 0
+                            # Number of DMX slots present; read straight out of the packet without slicing
+                            n = max(0, min(512, len(data) - 18))
                             
                             # Update DMX display values for matching universe
                             if universe == self.selected_universe:
-                                self.dmx_values[universe] = {i: dmx_data[i] if i < len(dmx_data) else 0 for i in range(512)}
+                                frame = self.dmx_values.get(universe)
+                                if frame is None:
+                                    frame = np.zeros(512, dtype=np.uint8) if HAS_NUMPY else bytearray(512)
+                                    self.dmx_values[universe] = frame
+                                if HAS_NUMPY:
+                                    frame[:n] = np.frombuffer(data, dtype=np.uint8, count=n, offset=18)
+                                    frame[n:] = 0
+                                else:
+                                    frame[:n] = memoryview(data)[18:18 + n]
+                                    frame[n:] = bytes(512 - n)
                             
                             if self.recording:
                                 # Check if universe should be captured (skip if filter is enabled and universe not in list)
@@ -6632,26 +7287,39 @@ class TimelineEditorGUI:
                                     # Apply channel filter if enabled
                                     payload_data = data
                                     header = data[:18]
-                                    dmx_data_full = bytearray(data[18:18+512] if len(data) > 18 else b"")
-                                    if len(dmx_data_full) < 512:
-                                        dmx_data_full.extend(b"\x00" * (512 - len(dmx_data_full)))
+                                    if HAS_NUMPY:
+                                        dmx_data_full = np.zeros(512, dtype=np.uint8)
+                                        dmx_data_full[:n] = np.frombuffer(data, dtype=np.uint8, count=n, offset=18)
+                                    else:
+                                        dmx_data_full = bytearray(512)
+                                        dmx_data_full[:n] = memoryview(data)[18:18 + n]
                                     any_change_vs_baseline = False
 
                                     if self.ignored_on_capture_enabled and universe in self.ignored_on_capture:
                                         # Record only learned channels that differ from baseline; store as sparse 'changes' dict
                                         learned = self.ignored_on_capture.get(universe, set())
                                         baseline = self.ignored_baseline.get(universe, {})
-                                        changes = {}
-                                        for ch in learned:
-                                            if ch < 512:
-                                                try:
-                                                    val = int(dmx_data_full[ch])
-                                                    base = int(baseline.get(ch, 0))
-                                                    if val != base:
-                                                        changes[ch] = val
-                                                        any_change_vs_baseline = True
-                                                except Exception:
-                                                    pass
+                                        if HAS_NUMPY:
+                                            arrays = self._learned_arrays.get(universe)
+                                            if arrays is None:
+                                                chans = sorted(ch for ch in learned if 0 <= ch < 512)
+                                                arrays = (np.array(chans, dtype=np.int32),
+                                                          np.array([int(baseline.get(ch, 0)) for ch in chans], dtype=np.uint8))
+                                                self._learned_arrays[universe] = arrays
+                                            changes = _diff_learned_channels(dmx_data_full, *arrays)
+                                            any_change_vs_baseline = bool(changes)
+                                        else:
+                                            changes = {}
+                                            for ch in learned:
+                                                if ch < 512:
+                                                    try:
+                                                        val = int(dmx_data_full[ch])
+                                                        base = int(baseline.get(ch, 0))
+                                                        if val != base:
+                                                            changes[ch] = val
+                                                            any_change_vs_baseline = True
+                                                    except Exception:
+                                                        pass
                                         # If no changes among learned channels, skip recording
                                         if not any_change_vs_baseline:
                                             continue
@@ -6667,7 +7335,13 @@ class TimelineEditorGUI:
                                             dmx_data = dmx_data_full
                                         sparse = False
 
-                                    payload_data = header + (bytes(dmx_data) if not (self.ignored_on_capture_enabled and universe in self.ignored_on_capture) else b"")
+                                    # Skip frames identical to the last one recorded for this universe
+                                    frame_key = changes if sparse else bytes(dmx_data)
+                                    if self._last_captured_frame.get(universe) == frame_key:
+                                        continue
+                                    self._last_captured_frame[universe] = frame_key
+
+                                    payload_data = header + (frame_key if not sparse else b"")
                                     
                                     # Use current playhead position as timestamp
                                     event = {
@@ -6688,9 +7362,10 @@ class TimelineEditorGUI:
                                         if not hasattr(self, 'timeline_data') or self.timeline_data is None:
                                             self.timeline_data = []
                                         self.timeline_data.append(event)
+                                        self._timeline_max_t = max(self._timeline_max_t, event["t"])
                                         # Invalidate cache to force redraw and schedule canvas update on main thread
                                         self.waveform_cached = False
-                                        self.root.after(0, self._update_canvas_view)
+                                        self._request_redraw(33)
                     except socket.timeout:
                         pass
                     except Exception:
@@ -6709,50 +7384,47 @@ class TimelineEditorGUI:
     def _update_dmx_display(self):
         """Update DMX monitor display with live updates - optimized to only update changed values."""
         universe = self.selected_universe
-        values = self.dmx_values.get(universe, {})
-        
-        # Get channels to update (respects filter if enabled)
-        channels_to_update = self.dmx_filter_channels if self.dmx_filter_enabled else range(512)
+        values = self.dmx_values.get(universe)
+        if values is None:
+            values = np.zeros(512, dtype=np.uint8) if HAS_NUMPY else bytearray(512)
+        else:
+            # The monitor thread writes frames in place; diff and draw one consistent copy
+            values = values.copy() if HAS_NUMPY else bytearray(values)
+        last = self._last_dmx_values
+        
+        # Only update channels that have changed since the last refresh
+        if last is None:
+            changed = range(512)
+        elif HAS_NUMPY:
+            changed = np.flatnonzero(values != last).tolist()
+        else:
+            changed = [ch for ch in range(512) if values[ch] != last[ch]]
+        # Respect the channel filter if enabled
+        allowed = set(self.dmx_filter_channels) if self.dmx_filter_enabled else None
         
-        # Only update channels that have changed
-        for ch in channels_to_update:
-            if ch not in self.dmx_labels:
-                continue
-                
-            val = values.get(ch, 0)
-            # Skip if value hasn't changed (optimization)
-            if hasattr(self, '_last_dmx_values') and self._last_dmx_values.get(ch) == val:
+        for ch in changed:
+            if ch not in self.dmx_labels or (allowed is not None and ch not in allowed):
                 continue
             
+            val = int(values[ch])
             value_label = self.dmx_labels[ch]["value"]
             
             # Update value color based on intensity
-            if val == 0:
-                color = "gray50"
-            elif val < 85:
-                color = "orange"
-            elif val < 170:
-                color = "yellow"
-            else:
-                color = "lime"
+            color = _DMX_LEVEL_COLORS[val]
             
             value_label.config(text=f"{val:3d}", foreground=color)
             
             # Update bar
-            bar = self.dmx_labels[ch]["bar"]
-            bar.delete("all")
-            # Use current bar canvas width for smoother scaling
-            try:
-                bw = max(40, int(bar.winfo_width()))
-            except Exception:
-                bw = 40
-            bar_width = int((val / 255.0) * bw)
-            if bar_width > 0:
-                bar_color = color if val > 0 else "gray20"
-                bar.create_rectangle(0, 0, bar_width, 8, fill=bar_color, outline=bar_color)
-        
-        # Cache current values for next comparison
-        self._last_dmx_values = values.copy()
+            entry = self.dmx_labels[ch]
+            bar = entry["bar"]
+            bar_width = int((val / 255.0) * entry["bar_w"])
+            bar_color = color if val > 0 else "gray20"
+            bar.coords(entry["bar_rect"], 0, 0, bar_width, 8)
+            bar.itemconfigure(entry["bar_rect"], fill=bar_color, outline=bar_color,
+                              state="normal" if bar_width > 0 else "hidden")
+        
+        # Cache exactly what was drawn for the next comparison
+        self._last_dmx_values = values
     
     def _update_dmx_monitor_loop(self):
         """Periodically update DMX monitor display."""
@@ -6785,11 +7457,9 @@ class TimelineEditorGUI:
     @staticmethod
     def _format_time(seconds):
         """Format seconds as MM:SS.mmm"""
-        td = timedelta(seconds=seconds)
-        total_seconds = int(td.total_seconds())
-        millis = int((seconds - total_seconds) * 1000)
-        mins = total_seconds // 60
-        secs = total_seconds % 60
+        # Integer milliseconds avoid building a timedelta on every label update
+        total_secs, millis = divmod(int(seconds * 1000), 1000)
+        mins, secs = divmod(total_secs, 60)
         return f"{mins}:{secs:02d}.{millis:03d}"
 
 
@@ -3,6 +3,41 @@ import socket
 import time
 import base64
 import threading
+import ctypes
+
+# Linux can push a whole burst of datagrams in one sendmmsg() syscall
+from timeline._mmsg import HAS_SENDMMSG, libc as _libc, SockaddrIn, IOVec, MMsgHdr
+
+_SNDBUF_SIZE = 1 << 20
+
+
+class _MMsgBatch:
+    """Pre-packed mmsghdr array so a run of payloads goes out in one syscall."""
+
+    def __init__(self, payloads, target, port):
+        count = len(payloads)
+        addr = socket.inet_aton(socket.gethostbyname(target))
+        self.addr = SockaddrIn(socket.AF_INET, socket.htons(port), (ctypes.c_ubyte * 4)(*addr))
+        # Keep the payload buffers alive for as long as the headers point at them
+        self.buffers = [ctypes.create_string_buffer(p, len(p)) for p in payloads]
+        self.iovecs = (IOVec * count)()
+        self.msgs = (MMsgHdr * count)()
+        addr_ptr = ctypes.cast(ctypes.pointer(self.addr), ctypes.c_void_p)
+        for i, buf in enumerate(self.buffers):
+            self.iovecs[i].iov_base = ctypes.cast(buf, ctypes.c_void_p)
+            self.iovecs[i].iov_len = len(payloads[i])
+            hdr = self.msgs[i].msg_hdr
+            hdr.msg_name = addr_ptr
+            hdr.msg_namelen = ctypes.sizeof(self.addr)
+            hdr.msg_iov = ctypes.pointer(self.iovecs[i])
+            hdr.msg_iovlen = 1
+
+    def send(self, fd, lo, hi):
+        """Send messages lo..hi-1; return how many the kernel accepted."""
+        ptr = ctypes.cast(ctypes.byref(self.msgs, lo * ctypes.sizeof(MMsgHdr)),
+                          ctypes.POINTER(MMsgHdr))
+        sent = _libc.sendmmsg(fd, ptr, hi - lo, 0)
+        return max(0, sent)
 
 
 class Player:
@@ -12,36 +47,84 @@ class Player:
         self.target = target
         self.port = port
         self.playing = False
+        self._stop_event = threading.Event()
     
     def play(self, events, speed=1.0):
         """Play back events."""
         self.playing = True
+        self._stop_event.clear()
+        stop_event = self._stop_event
+        
+        # Sort once and decode payloads up front so each tick only has to
+        # dispatch the events that have come due since the previous one.
+        # Events without a payload never send anything, so they are dropped here.
+        events = sorted(events, key=lambda e: e.get("t", 0))
+        times = []
+        payloads = []
+        for evt in events:
+            payload = evt.get("payload", "")
+            # Recorder events carry raw bytes; loaded JSON timelines carry base64 text
+            if isinstance(payload, (bytes, bytearray)):
+                payload = bytes(payload)
+            else:
+                try:
+                    payload = base64.b64decode(payload) if payload else b""
+                except Exception:
+                    payload = b""
+            if payload:
+                times.append(evt.get("t", 0))
+                payloads.append(payload)
+        # Playback runs until the last event's time, payload or not
+        end_time = events[-1].get("t", 0) if events else 0.0
         
         def playback_thread():
             try:
                 sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
                 sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+                # Never stall the schedule on a full send buffer; a dropped
+                # Art-Net frame is superseded by the next one anyway.
+                try:
+                    sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, _SNDBUF_SIZE)
+                except OSError:
+                    pass
+                sock.setblocking(False)
+                
+                batch = None
+                if HAS_SENDMMSG and payloads:
+                    try:
+                        batch = _MMsgBatch(payloads, self.target, self.port)
+                    except Exception:
+                        batch = None
                 
                 start_time = time.perf_counter()
+                next_idx = 0
+                count = len(payloads)
                 
                 while self.playing:
                     elapsed = (time.perf_counter() - start_time) * speed
                     
-                    for evt in events:
-                        evt_time = evt.get("t", 0)
-                        if abs(evt_time - elapsed) < 0.05:
-                            payload_b64 = evt.get("payload", "")
-                            try:
-                                payload = base64.b64decode(payload_b64) if payload_b64 else b""
-                                if payload:
-                                    sock.sendto(payload, (self.target, self.port))
-                            except:
-                                pass
+                    hi = next_idx
+                    while hi < count and times[hi] <= elapsed:
+                        hi += 1
+                    if batch is not None and hi > next_idx:
+                        next_idx += batch.send(sock.fileno(), next_idx, hi)
+                    # sendto() covers other platforms and anything sendmmsg left over
+                    while next_idx < hi:
+                        try:
+                            sock.sendto(payloads[next_idx], (self.target, self.port))
+                        except:
+                            pass
+                        next_idx += 1
                     
-                    if elapsed > max((e.get("t", 0) for e in events), default=0):
+                    if next_idx >= count and elapsed >= end_time:
                         break
                     
-                    time.sleep(0.016)
+                    # Sleep straight through to the next event; stop() wakes us early
+                    next_t = times[next_idx] if next_idx < count else end_time
+                    elapsed = (time.perf_counter() - start_time) * speed
+                    wait = (next_t - elapsed) / speed if speed > 0 else 0.016
+                    if wait > 0:
+                        stop_event.wait(wait)
                 
                 sock.close()
             except Exception as e:
@@ -53,3 +136,4 @@ class Player:
     def stop(self):
         """Stop playback."""
         self.playing = False
+        self._stop_event.set()
@@ -1,70 +1,399 @@
 """DMX Art-Net Timeline Recorder."""
+import ctypes
+import errno
+import heapq
+import mmap
+import os
+import selectors
 import socket
+import struct
+import sys
 import time
 import threading
-import base64
+from array import array
+from collections import deque
+from operator import itemgetter
+
+# Linux can return a whole burst of datagrams from one recvmmsg() syscall
+from timeline._mmsg import HAS_RECVMMSG, MSG_DONTWAIT, libc as _libc, IOVec, MMsgHdr
+
+# Numba compiles the packet header check when installed
+try:
+    import numpy as np
+    from numba import njit
+    HAS_NUMBA = True
+except Exception:
+    HAS_NUMBA = False
+
+# Art-Net ID followed by OpDmx (0x5000, little-endian); anything else on the port
+# (ArtPoll, ArtPollReply, ArtSync, ...) is not DMX data
+_ARTDMX_PREFIX = b"Art-Net\x00\x00\x50"
+
+# Kernel receive buffer requested for the capture socket; bursts across many
+# universes are queued here while the capture thread is busy
+_RCVBUF_SIZE = 12 * 1024 * 1024
+# Linux reports the socket's cumulative drop count as ancillary data when enabled
+_SO_RXQ_OVFL = getattr(socket, "SO_RXQ_OVFL", 40)
+_DROP_COUNT_CMSG_SIZE = socket.CMSG_SPACE(4) if hasattr(socket, "CMSG_SPACE") else 0
+# struct cmsghdr (cmsg_len, cmsg_level, cmsg_type) and where its data starts
+_CMSG_HEADER = struct.Struct("@Nii")
+_CMSG_DATA_OFFSET = socket.CMSG_LEN(0) if hasattr(socket, "CMSG_LEN") else _CMSG_HEADER.size
+# Most datagrams read per selector wakeup before the rows are merged into the columns
+_DRAIN_BATCH = 64
+# Capture-thread errors kept for the caller to collect with drain_errors()
+_MAX_ERRORS = 64
+# Spill file record header: t_ns, universe, payload length, followed by the payload
+_SPILL_HEADER = struct.Struct("<QHH")
+# Write buffer for the spill file; the OS page cache absorbs the rest
+_SPILL_BUFFER_SIZE = 1 << 20
+# Every recorded event starts as a copy of this; opcode and session never vary
+_EVENT_TEMPLATE = {"t": 0.0, "universe": 0, "opcode": 80, "session": 1, "payload": b""}
+# SCHED_FIFO priority requested for the capture thread (needs CAP_SYS_NICE; ignored otherwise)
+_CAPTURE_RT_PRIORITY = 10
+
+
+def _artnet_universe(b):
+    """15-bit Art-Net port-address: SubUni (byte 14) plus the 7-bit Net (byte 15)."""
+    return b[14] | ((b[15] & 0x7F) << 8)
+
+
+def _artdmx_universe(buf, n):
+    """Return the universe of the ArtDmx packet in buf[:n], or -1 if it is not one."""
+    if n > 18 and buf.startswith(_ARTDMX_PREFIX):
+        return _artnet_universe(buf)
+    return -1
+
+
+def _artdmx_universe_kernel(a, n):
+    """Array version of `_artdmx_universe` for numba: compares the header byte by byte."""
+    if n <= 18:
+        return -1
+    # "Art-Net\0" then OpDmx 0x5000 little-endian
+    if (a[0] != 65 or a[1] != 114 or a[2] != 116 or a[3] != 45 or a[4] != 78
+            or a[5] != 101 or a[6] != 116 or a[7] != 0 or a[8] != 0 or a[9] != 0x50):
+        return -1
+    return a[14] | ((a[15] & 0x7F) << 8)
+
+
+if HAS_NUMBA:
+    _artdmx_universe_kernel = njit(cache=True)(_artdmx_universe_kernel)
+
+
+def _tune_capture_thread(cpu):
+    """Pin the calling thread to `cpu` (if given) and ask for real-time scheduling."""
+    if cpu is not None:
+        try:
+            os.sched_setaffinity(0, {cpu})
+        except (AttributeError, OSError, ValueError):
+            pass
+    try:
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(_CAPTURE_RT_PRIORITY))
+    except (AttributeError, OSError):
+        pass
+
+
+class _MMsgReceiver:
+    """recvmmsg() straight into the caller's bytearrays: one syscall per burst of datagrams."""
+
+    def __init__(self, buffers, control_size):
+        count = len(buffers)
+        self.count = count
+        self.control_size = control_size
+        self.iovecs = (IOVec * count)()
+        self.msgs = (MMsgHdr * count)()
+        # ctypes views share memory with the bytearrays, so the kernel writes into them directly
+        self.c_buffers = [(ctypes.c_char * len(b)).from_buffer(b) for b in buffers]
+        self.controls = [ctypes.create_string_buffer(control_size) for _ in range(count)] if control_size else []
+        for i, cbuf in enumerate(self.c_buffers):
+            self.iovecs[i].iov_base = ctypes.addressof(cbuf)
+            self.iovecs[i].iov_len = len(buffers[i])
+            hdr = self.msgs[i].msg_hdr
+            hdr.msg_iov = ctypes.pointer(self.iovecs[i])
+            hdr.msg_iovlen = 1
+            if control_size:
+                hdr.msg_control = ctypes.addressof(self.controls[i])
+
+    def recv(self, fd):
+        """Receive up to `count` datagrams without blocking; return their lengths."""
+        if self.control_size:
+            # The kernel shrinks msg_controllen to what it wrote, so restore it each call
+            for msg in self.msgs:
+                msg.msg_hdr.msg_controllen = self.control_size
+        got = _libc.recvmmsg(fd, self.msgs, self.count, MSG_DONTWAIT, None)
+        if got < 0:
+            err = ctypes.get_errno()
+            if err in (errno.EAGAIN, errno.EWOULDBLOCK):
+                return []
+            raise OSError(err, os.strerror(err))
+        return [self.msgs[i].msg_len for i in range(got)]
+
+    def drop_count(self, i):
+        """SO_RXQ_OVFL drop counter delivered with message i, or None."""
+        if not self.control_size or self.msgs[i].msg_hdr.msg_controllen < _CMSG_DATA_OFFSET + 4:
+            return None
+        raw = self.controls[i].raw
+        _, level, kind = _CMSG_HEADER.unpack_from(raw)
+        if level == socket.SOL_SOCKET and kind == _SO_RXQ_OVFL:
+            return struct.unpack_from("=I", raw, _CMSG_DATA_OFFSET)[0]
+        return None
 
 
 class Recorder:
     """Record DMX events from Art-Net."""
     
-    def __init__(self, port=6454):
+    def __init__(self, port=6454, cpu=None, spill_path=None, shards=1):
         self.port = port
+        # CPU the capture thread is pinned to (Linux only); None leaves it to the scheduler.
+        # With several shards, shard i is pinned to cpu + i.
+        self.cpu = cpu
+        # Capture threads, each with its own SO_REUSEPORT socket; the kernel spreads unicast
+        # senders across them. Broadcast datagrams reach every socket, so keep 1 for broadcast
+        # Art-Net. Ignored (1) with a spill file or without SO_REUSEPORT.
+        self.shards = shards
+        # When set, captured frames are appended to this binary file instead of kept in memory
+        self.spill_path = spill_path
+        self._spill = None
         self.recording = False
         self.events = []
-        self.sock = None
+        self._reset_columns(1)
+        self.socks = []
+        self._threads = []
+        # stop() writes a byte here to wake the capture threads out of their selectors
+        self._wake_r = self._wake_w = None
+        # Receive buffer size granted by the kernel (may be clamped to net.core.rmem_max)
+        self.rcvbuf = None
+        # Per-shard count of packets the kernel dropped because the receive buffer was full (Linux only)
+        self._drops = [0]
+        # (time, repr) of errors on the capture thread; it never prints or blocks on I/O
+        self.errors = deque(maxlen=_MAX_ERRORS)
     
     def start(self):
         """Start recording."""
         self.recording = True
         self.events = []
+        shards = self.shards if self.spill_path is None and hasattr(socket, "SO_REUSEPORT") else 1
+        shards = max(1, shards)
+        self._reset_columns(shards)
+        self._drops = [0] * shards
+        self.socks = []
+        self._threads = []
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._spill = open(self.spill_path, "wb", buffering=_SPILL_BUFFER_SIZE) if self.spill_path else None
         
-        def record_thread():
+        spill = self._spill
+        wake_r = self._wake_r
+        # Shared so every shard's timestamps are on the same clock
+        start_ns = time.perf_counter_ns()
+        
+        def record_thread(shard):
+            _tune_capture_thread(None if self.cpu is None else self.cpu + shard)
             try:
-                self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-                self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-                self.sock.bind(("", self.port))
-                self.sock.settimeout(0.1)
+                sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+                self.socks.append(sock)
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                if shards > 1:
+                    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+                sock.bind(("", self.port))
+                try:
+                    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _RCVBUF_SIZE)
+                except OSError:
+                    pass
+                if shard == 0:
+                    self.rcvbuf = sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)
+                track_drops = False
+                if sys.platform.startswith("linux") and _DROP_COUNT_CMSG_SIZE:
+                    try:
+                        sock.setsockopt(socket.SOL_SOCKET, _SO_RXQ_OVFL, 1)
+                        track_drops = True
+                    except OSError:
+                        pass
+                # Sleep in the selector until packets arrive, then drain everything queued
+                sock.setblocking(False)
+                sel = selectors.DefaultSelector()
+                sel.register(sock, selectors.EVENT_READ)
+                # Never read, so it stays readable for every shard once stop() writes to it
+                sel.register(wake_r, selectors.EVENT_READ)
                 
-                start_time = time.perf_counter()
+                times, universes, payloads = self._columns[shard]
+                pack_header = _SPILL_HEADER.pack
+                # One receive buffer per burst slot for the whole session; only the DMX slots are copied out
+                buffers = [bytearray(4096) for _ in range(_DRAIN_BATCH)]
+                views = [memoryview(b) for b in buffers]
+                # The jitted header check reads uint8 views over the same buffers
+                if HAS_NUMBA:
+                    parse, packets = _artdmx_universe_kernel, [np.frombuffer(b, dtype=np.uint8) for b in buffers]
+                    parse(packets[0], 0)  # compile now rather than on the first packet
+                else:
+                    parse, packets = _artdmx_universe, buffers
+                receiver = None
+                if HAS_RECVMMSG:
+                    try:
+                        receiver = _MMsgReceiver(buffers, _DROP_COUNT_CMSG_SIZE if track_drops else 0)
+                    except Exception:
+                        receiver = None
+                # Last frame stored per universe; controllers resend unchanged frames constantly
+                last_frames = {}
                 
                 while self.recording:
-                    try:
-                        data, addr = self.sock.recvfrom(4096)
-                        elapsed = time.perf_counter() - start_time
-                        
-                        if len(data) > 18:
-                            universe = data[14] if len(data) > 14 else 0
-                            dmx_data = data[18:18+512] if len(data) > 18 else b""
-                            payload_b64 = base64.b64encode(dmx_data).decode()
-                            
-                            evt = {
-                                "t": elapsed,
-                                "universe": universe,
-                                "opcode": 80,
-                                "session": 1,
-                                "payload": payload_b64
-                            }
-                            self.events.append(evt)
-                    except socket.timeout:
-                        continue
+                    if any(key.fileobj is wake_r for key, _ in sel.select()):
+                        break
+                    lengths, stamps = [], []
+                    if receiver is not None:
+                        try:
+                            lengths = receiver.recv(sock.fileno())
+                        except OSError as e:
+                            # Note it and keep capturing
+                            if self.recording:
+                                self.errors.append((time.time(), repr(e)))
+                        # One timestamp per burst: every datagram in it was already queued
+                        stamps = [time.perf_counter_ns() - start_ns] * len(lengths)
+                        if track_drops and lengths:
+                            drops = receiver.drop_count(len(lengths) - 1)
+                            if drops is not None:
+                                self._drops[shard] = drops
+                    else:
+                        for buf in buffers:
+                            try:
+                                if track_drops:
+                                    n, ancdata, _flags, addr = sock.recvmsg_into([buf], _DROP_COUNT_CMSG_SIZE)
+                                    for level, kind, cdata in ancdata:
+                                        if level == socket.SOL_SOCKET and kind == _SO_RXQ_OVFL and len(cdata) >= 4:
+                                            self._drops[shard] = struct.unpack_from("=I", cdata)[0]
+                                else:
+                                    n, addr = sock.recvfrom_into(buf)
+                            except BlockingIOError:
+                                break
+                            except OSError as e:
+                                if self.recording:
+                                    self.errors.append((time.time(), repr(e)))
+                                break
+                            lengths.append(n)
+                            stamps.append(time.perf_counter_ns() - start_ns)
+                    
+                    batch_t, batch_u, batch_p = [], [], []
+                    for i, n in enumerate(lengths):
+                        universe = int(parse(packets[i], n))
+                        if universe < 0:
+                            continue
+                        # A valid ArtDmx header already implies n > 18
+                        dmx_data = bytes(views[i][18:min(n, 18 + 512)])
+                        if last_frames.get(universe) == dmx_data:
+                            continue
+                        last_frames[universe] = dmx_data
+                        batch_t.append(stamps[i])
+                        batch_u.append(universe)
+                        batch_p.append(dmx_data)
+                    if batch_p and spill is not None:
+                        spill.write(b"".join(pack_header(t, u, len(p)) + p
+                                             for t, u, p in zip(batch_t, batch_u, batch_p)))
+                    elif batch_p:
+                        times.extend(batch_t)
+                        universes.extend(batch_u)
+                        # Payloads last: their count marks how many rows are complete
+                        payloads.extend(batch_p)
                 
-                self.sock.close()
+                sel.close()
+                sock.close()
             except Exception as e:
-                print(f"Record error: {e}")
+                self.errors.append((time.time(), repr(e)))
+            finally:
+                if spill is not None:
+                    spill.close()
         
-        thread = threading.Thread(target=record_thread, daemon=True)
-        thread.start()
+        for shard in range(shards):
+            thread = threading.Thread(target=record_thread, args=(shard,), daemon=True)
+            thread.start()
+            self._threads.append(thread)
     
     def stop(self):
-        """Stop recording."""
+        """Stop recording and wait for the capture threads to finish."""
         self.recording = False
-        if self.sock:
+        if self._wake_w is not None:
             try:
-                self.sock.close()
+                self._wake_w.send(b"x")
+            except OSError:
+                pass
+        for thread in self._threads:
+            thread.join(timeout=1.0)
+        self._threads = []
+        # Threads close their own sockets; this covers one that died before it got there
+        for sock in list(self.socks) + [self._wake_r, self._wake_w]:
+            try:
+                if sock is not None:
+                    sock.close()
             except:
                 pass
+        self._wake_r = self._wake_w = None
+    
+    @property
+    def dropped(self):
+        """Packets the kernel dropped because a receive buffer was full (Linux only)."""
+        return sum(self._drops)
+    
+    def drain_errors(self):
+        """Return and clear the (time, repr) errors recorded by the capture thread."""
+        errors = []
+        while self.errors:
+            errors.append(self.errors.popleft())
+        return errors
+    
+    def _reset_columns(self, shards):
+        """Start empty capture columns per shard: one row per recorded frame."""
+        # (t, universe, payload) per shard; t is integer nanoseconds since start,
+        # converted to seconds only in get_events()
+        self._columns = [(array("q"), array("H"), []) for _ in range(shards)]
+        # Rows of each shard already converted into self.events
+        self._converted = [0] * shards
+    
+    def iter_events(self):
+        """Yield recorded events one at a time; spilled frames are read from disk on demand."""
+        if not self.spill_path:
+            yield from self.get_events()
+            return
+        try:
+            self._spill.flush()
+        except (AttributeError, ValueError):
+            pass  # not recording, or the capture thread already closed the file
+        with open(self.spill_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                pos, end = 0, len(m)
+                header_size = _SPILL_HEADER.size
+                new_event = _EVENT_TEMPLATE.copy
+                while pos + header_size <= end:
+                    t_ns, universe, size = _SPILL_HEADER.unpack_from(m, pos)
+                    pos += header_size
+                    event = new_event()
+                    event["t"] = t_ns / 1e9
+                    event["universe"] = universe
+                    event["payload"] = m[pos:pos + size]
+                    yield event
+                    pos += size
     
     def get_events(self):
-        """Get recorded events."""
+        """Get recorded events, converting any rows captured since the last call.
+
+        Payloads are the raw DMX bytes; `timeline.format.save_timeline` base64-encodes
+        them when writing JSON. With a spill file every event is loaded into memory;
+        use `iter_events` to stream them instead.
+        """
+        if self.spill_path:
+            self.events = list(self.iter_events())
+            return self.events
+        rows = []
+        for shard, (times, universes, payloads) in enumerate(self._columns):
+            start, end = self._converted[shard], len(payloads)
+            rows.append(zip(times[start:end], universes[start:end], payloads[start:end]))
+            self._converted[shard] = end
+        # Each shard is already in time order; interleave them
+        if len(rows) > 1:
+            rows = [heapq.merge(*rows, key=itemgetter(0))]
+        events, new_event = self.events, _EVENT_TEMPLATE.copy
+        for t_ns, universe, payload in rows[0]:
+            event = new_event()
+            event["t"] = t_ns / 1e9
+            event["universe"] = universe
+            event["payload"] = payload
+            events.append(event)
         return self.events
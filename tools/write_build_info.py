@@ -1,19 +1,41 @@
 import os
+import sys
 import json
 import datetime
 
+try:
+    import orjson
+except Exception:
+    orjson = None
+
 def main():
+    # --stable: leave an existing file alone when only build_time would change
+    stable = '--stable' in sys.argv[1:]
     here = os.path.dirname(os.path.abspath(__file__))
     # Target next to gui.py in timeline package
     timeline_dir = os.path.join(os.path.dirname(here), 'timeline')
     os.makedirs(timeline_dir, exist_ok=True)
     target = os.path.join(timeline_dir, 'build_info.json')
     info = {
-        'build_time': datetime.datetime.utcnow().isoformat() + 'Z'
+        'build_time': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds').replace('+00:00', 'Z')
     }
-    with open(target, 'w', encoding='utf-8') as f:
-        json.dump(info, f, indent=2)
+    if stable:
+        try:
+            with open(target, 'r', encoding='utf-8') as f:
+                old = json.load(f)
+            if isinstance(old, dict) and 'build_time' in old and \
+                    {k: v for k, v in old.items() if k != 'build_time'} == {k: v for k, v in info.items() if k != 'build_time'}:
+                print(f'{target} is up to date')
+                return
+        except (OSError, ValueError):
+            pass
+    if orjson is not None:
+        with open(target, 'wb') as f:
+            f.write(orjson.dumps(info, option=orjson.OPT_INDENT_2))
+    else:
+        with open(target, 'w', encoding='utf-8') as f:
+            json.dump(info, f, indent=2)
     print(f'Wrote {target}')
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()